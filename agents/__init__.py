@@ -1,3 +1,13 @@
-from agents.stages import secops_pipeline
+from typing import Any
 
 __all__ = ["secops_pipeline"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing any agents.* submodule runs this package first; building the
+    # whole pipeline is deferred until it is actually requested.
+    if name in __all__:
+        from agents import stages
+
+        return getattr(stages, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
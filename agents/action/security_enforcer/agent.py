@@ -7,13 +7,16 @@ Uses self-contained execution tools (no CAI dependency).
 Tools:
 - Execution: generic_linux_command, run_ssh_command_with_credentials, execute_code
 - Remediation: disable_credentials, rotate_credentials, isolate_system, etc.
+- Batching: execute_plan (concurrent, independent remediations)
 
 High-risk tools are wrapped with FunctionTool(require_confirmation=True)
-to gate destructive actions behind human approval.
+to gate destructive actions behind human approval. Every tool is registered
+as a CachedFunctionTool so its schema is reflected once per process.
 """
 
 from google.adk.agents import Agent
-from google.adk.tools import FunctionTool
+
+from shared.adk.schema_cache import CachedFunctionTool, cached_tool
 
 from config.settings import get_model_for_agent
 from agents.action.security_enforcer.prompts import ACTION_KAMEN_INSTRUCTION, ACTION_KAMEN_DESCRIPTION
@@ -21,9 +24,16 @@ from agents.action.security_enforcer.prompts import ACTION_KAMEN_INSTRUCTION, AC
 # =============================================================================
 # Execution Tools (self-contained, no CAI dependency)
 # =============================================================================
-from shared.security_tools.linux_command import generic_linux_command_sync as generic_linux_command
-from shared.security_tools.ssh_command import run_ssh_command_with_credentials
-from shared.security_tools.code_executor import execute_code
+from shared.security_tools.linux_command import generic_linux_command_sync
+from shared.security_tools.ssh_command import run_ssh_command_with_credentials as _ssh_command
+from shared.security_tools.code_executor import execute_code as _execute_code
+from shared.security_tools.rate_limit import rate_limited
+
+# Shared executors get the high-risk admission budget here; the remediation
+# tools below carry their own tier in tools.py.
+generic_linux_command = rate_limited("high")(generic_linux_command_sync)
+run_ssh_command_with_credentials = rate_limited("high")(_ssh_command)
+execute_code = rate_limited("high")(_execute_code)
 
 # =============================================================================
 # Remediation Tools
@@ -36,6 +46,7 @@ from agents.action.security_enforcer.tools import (
     terminate_process,
     rollback_changes,
     execute_command,
+    execute_plan,
     verify_remediation,
 )
 
@@ -43,26 +54,11 @@ from agents.action.security_enforcer.tools import (
 # Tool confirmation wrappers — high-risk tools require human approval
 # =============================================================================
 
-# These 5 tools can execute arbitrary commands, kill processes, or isolate
+# These tools can execute arbitrary commands, kill processes, or isolate
 # systems. They MUST be gated behind confirmation before running.
-_confirmed_terminate_process = FunctionTool(
-    func=terminate_process, require_confirmation=True
-)
-_confirmed_isolate_system = FunctionTool(
-    func=isolate_system, require_confirmation=True
-)
-_confirmed_execute_command = FunctionTool(
-    func=execute_command, require_confirmation=True
-)
-_confirmed_linux_command = FunctionTool(
-    func=generic_linux_command, require_confirmation=True
-)
-_confirmed_execute_code = FunctionTool(
-    func=execute_code, require_confirmation=True
-)
-_confirmed_ssh_command = FunctionTool(
-    func=run_ssh_command_with_credentials, require_confirmation=True
-)
+def _confirmed(fn) -> CachedFunctionTool:
+    """Return the (memoized) confirmation-gated wrapper for ``fn``."""
+    return cached_tool(fn, require_confirmation=True)
 
 
 # =============================================================================
@@ -70,21 +66,22 @@ _confirmed_ssh_command = FunctionTool(
 # =============================================================================
 
 # All tools available to Action Kamen
-security_enforcer_tools = [
+security_enforcer_tools = (
     # High-risk (require confirmation)
-    _confirmed_linux_command,
-    _confirmed_ssh_command,
-    _confirmed_execute_code,
-    _confirmed_terminate_process,
-    _confirmed_isolate_system,
-    _confirmed_execute_command,
+    _confirmed(generic_linux_command),
+    _confirmed(run_ssh_command_with_credentials),
+    _confirmed(execute_code),
+    _confirmed(terminate_process),
+    _confirmed(isolate_system),
+    _confirmed(execute_command),
+    _confirmed(execute_plan),
     # Low-risk (no confirmation)
-    disable_credentials,
-    rotate_credentials,
-    block_network_traffic,
-    rollback_changes,
-    verify_remediation,
-]
+    cached_tool(disable_credentials),
+    cached_tool(rotate_credentials),
+    cached_tool(block_network_traffic),
+    cached_tool(rollback_changes),
+    cached_tool(verify_remediation),
+)
 
 
 # Create the Action Kamen agent (renamed to security_enforcer for consistency)
@@ -98,4 +95,4 @@ security_enforcer_agent = Agent(
 )
 
 
-__all__ = ["security_enforcer_agent"]
+__all__ = ["security_enforcer_agent", "security_enforcer_tools"]
@@ -16,17 +16,270 @@ TODO LIST FOR PRODUCTION:
 7. execute_command: Implement secure SSH/remote execution with audit logging
 """
 
+import asyncio
+import atexit
+import os
+import queue
+import re
+import select
+import shlex
+import shutil
+import signal
+import subprocess
+import threading
 import time
-import uuid
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+try:  # Optional: the Docker SDK keeps one API connection open across calls.
+    import docker as docker_sdk
+except ImportError:  # falls back to the docker CLI
+    docker_sdk = None
 
 from config.settings import MOCK_MODE, MOCK_DELAY_SECONDS
 from config.constants import REMEDIATION_ACTIONS
+from shared.security.policy_loader import find_blocked_command, get_confirmation_tools
+from shared.security_tools.rate_limit import is_rate_limited, rate_limited
+from shared.tools.asset_discovery_tools import discover_runtime_assets
+from shared.tools.monitoring_tools import fetch_metrics
+from shared.utils.cache import ttl_cache
+
+
+# =============================================================================
+# Command safety
+# =============================================================================
+
+_DANGEROUS_PATTERNS = ("rm -rf /", "mkfs", ":(){:|:&};:")
+
+# One alternation compiled at import: a single C-level scan per command, no
+# matter how many patterns are listed.
+_DANGER_RE = re.compile("|".join(map(re.escape, _DANGEROUS_PATTERNS)))
+
+
+# =============================================================================
+# Persistent shell pool (execute_command)
+# =============================================================================
+
+_SHELL_ARGV = ["/bin/bash", "--noprofile", "--norc", "-s"]
+_SHELL_POOL_SIZE = 2
+_READ_CHUNK = 65536
+# Only the tail of each stream is kept, so a runaway `find /` can't exhaust
+# memory; the model gets the most recent output plus a truncated flag.
+_OUTPUT_CAP = 64 * 1024
+
+
+class _ShellWorker:
+    """A long-lived bash process that runs one command at a time.
+
+    Each command runs in a subshell so ``cd``/``exit``/env changes never leak
+    into the worker. Completion is detected by a per-request sentinel written
+    to both stdout (carrying the exit code) and stderr.
+    """
+
+    def __init__(self) -> None:
+        self.proc = subprocess.Popen(
+            _SHELL_ARGV,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+            start_new_session=True,
+        )
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self.proc.pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        for stream in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            if stream is not None:
+                stream.close()
+
+    def run(self, command: str, cwd: str, timeout: float) -> Tuple[int, str, str, bool]:
+        marker = f"__END__{os.urandom(16).hex()}__".encode()
+        script = (
+            f"( cd {shlex.quote(cwd)} && eval {shlex.quote(command)} ) </dev/null\n"
+            f"printf '\\n%s%s\\n' {marker.decode()} $?\n"
+            f"printf '\\n%s\\n' {marker.decode()} >&2\n"
+        )
+        self.proc.stdin.write(script.encode())
+
+        out_fd = self.proc.stdout.fileno()
+        err_fd = self.proc.stderr.fileno()
+        buffers = {out_fd: bytearray(), err_fd: bytearray()}
+        pending = {out_fd, err_fd}
+        truncated = False
+        deadline = time.monotonic() + timeout
+        keep = _OUTPUT_CAP + len(marker) + 16
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(command, timeout)
+            ready, _, _ = select.select(list(pending), [], [], remaining)
+            for fd in ready:
+                chunk = os.read(fd, _READ_CHUNK)
+                if not chunk:
+                    raise RuntimeError("Shell worker exited unexpectedly")
+                buf = buffers[fd]
+                buf += chunk
+                # The sentinel is the last line, so a tail check is enough.
+                if marker in buf[-(len(chunk) + len(marker) + 16):]:
+                    pending.discard(fd)
+                # Trim with one chunk of slack so the copy is amortized; keep
+                # room for the sentinel line so a full cap of output survives.
+                if len(buf) > keep + _READ_CHUNK:
+                    del buf[:len(buf) - keep]
+                    truncated = True
+
+        out = bytes(buffers[out_fd])
+        err = bytes(buffers[err_fd])
+        out_idx = out.rfind(b"\n" + marker)
+        err_idx = err.rfind(b"\n" + marker)
+        exit_code = int(out[out_idx + len(marker) + 1:].strip() or 1)
+        stdout, stderr = out[:out_idx], err[:err_idx]
+        if len(stdout) > _OUTPUT_CAP or len(stderr) > _OUTPUT_CAP:
+            truncated = True
+        return (
+            exit_code,
+            stdout[-_OUTPUT_CAP:].decode(errors="replace"),
+            stderr[-_OUTPUT_CAP:].decode(errors="replace"),
+            truncated,
+        )
+
+
+class _ShellPool:
+    """Bounded pool of :class:`_ShellWorker` processes, spawned on demand.
+
+    Workers that time out or die are discarded; the next caller spawns a
+    fresh one in their place.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._idle: "queue.Queue[_ShellWorker]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def run(self, command: str, cwd: str, timeout: float) -> Tuple[int, str, str, bool]:
+        with self._slots:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = None
+            if worker is None or not worker.alive():
+                worker = _ShellWorker()
+            try:
+                result = worker.run(command, cwd, timeout)
+            except BaseException:
+                worker.kill()
+                raise
+            self._idle.put(worker)
+            return result
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+
+_SHELL_POOL = _ShellPool(_SHELL_POOL_SIZE)
+atexit.register(_SHELL_POOL.close)
+
+
+# =============================================================================
+# Direct (shell-less) process execution
+# =============================================================================
+
+_DOCKER = shutil.which("docker") or "/usr/bin/docker"
+_DOCKER_TIMEOUT_SECONDS = 10
+# Leading character is alphanumeric so an id can never be parsed as a docker CLI option.
+_CONTAINER_ID_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,127}")
+
+
+async def _run_process(*argv: str, timeout: Optional[float] = None) -> Tuple[int, str, str]:
+    """Run ``argv`` without blocking the event loop; return (rc, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(list(argv), timeout)
+    return (
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+# =============================================================================
+# Docker access (SDK client when installed, CLI otherwise)
+# =============================================================================
+
+_DOCKER_CLIENT = None
+
 
+def _docker_client():
+    """Return the shared Docker SDK client, or None to use the CLI."""
+    global _DOCKER_CLIENT
+    if _DOCKER_CLIENT is None and docker_sdk is not None:
+        try:
+            _DOCKER_CLIENT = docker_sdk.from_env(timeout=_DOCKER_TIMEOUT_SECONDS)
+        except Exception:
+            return None
+    return _DOCKER_CLIENT
 
 
-def disable_credentials(
+async def _docker_call(sdk_call, *cli_args: str) -> Tuple[int, str]:
+    """Run a Docker operation; return (returncode, error text)."""
+    client = _docker_client()
+    if client is None:
+        returncode, _, stderr = await _run_process(
+            _DOCKER, *cli_args, timeout=_DOCKER_TIMEOUT_SECONDS
+        )
+        return returncode, stderr
+    try:
+        await asyncio.to_thread(sdk_call, client)
+    except Exception as e:
+        return 1, str(e)
+    return 0, ""
+
+
+
+async def _mock_delay() -> None:
+    # Skip the event-loop round trip entirely when no delay is configured.
+    if MOCK_DELAY_SECONDS > 0:
+        await asyncio.sleep(MOCK_DELAY_SECONDS)
+
+
+def _new_action_id(prefix: str) -> str:
+    return f"{prefix}-{os.urandom(4).hex()}"
+
+
+def _pack(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop empty fields so tool results stay small in the conversation history."""
+    return {key: value for key, value in result.items() if value is not None and value != ""}
+
+
+def _invalidate_reads() -> None:
+    """Drop memoized verification/discovery results after a mutating action."""
+    verify_remediation.cache_clear()
+    discover_runtime_assets.cache_clear()
+    fetch_metrics.cache_clear()
+
+
+@rate_limited("medium")
+async def disable_credentials(
     credential_id: str,
     credential_type: str = "user",
     reason: str = "Security incident"
@@ -35,13 +288,12 @@ def disable_credentials(
     # But user asked for real env - we can't really disable Mac users easily without sudo
     # So we'll keep this one mock or just return NotImplemented
    
-    action_id = f"cred-disable-{uuid.uuid4().hex[:8]}"
     if MOCK_MODE:
          # Keep mock for credential tools unless we want to mess with /etc/shadow really?
          # User said "implement all things", but disabling my own user is suicide.
-         time.sleep(MOCK_DELAY_SECONDS)
+         await _mock_delay()
          return {
-            "action_id": action_id,
+            "action_id": _new_action_id("cred-disable"),
             "success": True,
             "action": "disable_credentials",
             "target": credential_id,
@@ -53,51 +305,52 @@ def disable_credentials(
         "error": "Real credential disabling requires root/IAM integration not available on host."
     }
 
-def rotate_credentials(
+@rate_limited("low")
+async def rotate_credentials(
     credential_id: str,
     credential_type: str = "user",
     notify_owner: bool = True
 ) -> Dict[str, Any]:
-    action_id = f"cred-rotate-{uuid.uuid4().hex[:8]}"
     if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
+        await _mock_delay()
         return {
-            "action_id": action_id, "success": True, "mock_mode": True,
+            "action_id": _new_action_id("cred-rotate"), "success": True, "mock_mode": True,
             "action": "rotate_credentials"
         }
     return {"success": False, "error": "Real credential rotation not implemented"}
 
-def block_network_traffic(
+@rate_limited("medium")
+async def block_network_traffic(
     target: str,
     target_type: str = "ip",
     direction: str = "both",
     affected_systems: Optional[List[str]] = None
 ) -> Dict[str, Any]:
-    action_id = f"block-{uuid.uuid4().hex[:8]}"
     if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
+        await _mock_delay()
         return {
-            "action_id": action_id, "success": True, "mock_mode": True,
+            "action_id": _new_action_id("block"), "success": True, "mock_mode": True,
             "action": "block_network_traffic"
         }
     return {"success": False, "error": "Real network blocking requires iptables/pf (sudo)"}
 
-def rollback_changes(
+@rate_limited("medium")
+async def rollback_changes(
     change_id: str,
     change_type: str,
     target_system: str,
     rollback_data: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    action_id = f"rollback-{uuid.uuid4().hex[:8]}"
     if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
+        await _mock_delay()
         return {
-            "action_id": action_id, "success": True, "mock_mode": True,
+            "action_id": _new_action_id("rollback"), "success": True, "mock_mode": True,
             "action": "rollback_changes"
         }
     return {"success": False, "error": "Real rollback not implemented"}
 
-def isolate_system(
+@rate_limited("high")
+async def isolate_system(
     system_id: str,
     isolation_level: str = "network",
     preserve_logging: bool = True
@@ -105,41 +358,44 @@ def isolate_system(
     """
     Isolate a system. Implementation uses Docker for containers.
     """
-    import subprocess
-    action_id = f"isolate-{uuid.uuid4().hex[:8]}"
-    
     if MOCK_MODE:
          # ... existing mock ...
-         time.sleep(MOCK_DELAY_SECONDS)
-         return {"success": True, "mock_mode": True, "action_id": action_id}
+         await _mock_delay()
+         return {"success": True, "mock_mode": True, "action_id": _new_action_id("isolate")}
 
     # REAL IMPLEMENTATION
+    action_id = _new_action_id("isolate")
     try:
         # Check if it looks like a container
         if system_id.startswith("pod/") or system_id.startswith("container/"):
             # Clean ID
             cid = system_id.split("/")[-1]
-            
+            if not _CONTAINER_ID_RE.fullmatch(cid):
+                return {"success": False, "error": f"Invalid container id: {cid!r}"}
+
             # Docker isolate
             # disconnect from bridge network
-            cmd = f"docker network disconnect bridge {cid}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            returncode, stderr = await _docker_call(
+                lambda client: client.networks.get("bridge").disconnect(cid),
+                "network", "disconnect", "bridge", cid,
+            )
+            _invalidate_reads()
+
+            if returncode == 0:
                 return {
                     "action_id": action_id,
                     "success": True,
                     "action": "isolate_system",
                     "target": system_id,
                     "details": "Disconnected from bridge network",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": int(time.time())
                 }
             else:
                  return {
                     "action_id": action_id,
                     "success": False,
-                    "error": f"Docker error: {result.stderr}",
-                    "timestamp": datetime.now().isoformat()
+                    "error": f"Docker error: {stderr}",
+                    "timestamp": int(time.time())
                 }
         else:
              return {
@@ -151,7 +407,8 @@ def isolate_system(
         return {"success": False, "error": str(e)}
 
 
-def terminate_process(
+@rate_limited("high")
+async def terminate_process(
     process_identifier: str,
     identifier_type: str = "pid",
     target_system: str = "localhost",
@@ -160,38 +417,40 @@ def terminate_process(
     """
     Terminate a process using local kill or docker kill.
     """
-    import subprocess
-    action_id = f"terminate-{uuid.uuid4().hex[:8]}"
     
     if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
-        return {"success": True, "mock_mode": True, "action_id": action_id}
+        await _mock_delay()
+        return {"success": True, "mock_mode": True, "action_id": _new_action_id("terminate")}
 
     # REAL IMPLEMENTATION
     try:
         if identifier_type == "container_id" or target_system.startswith("pod/"):
              # Use docker kill
              target = process_identifier
-             cmd = ["docker", "kill", target]
-             result = subprocess.run(cmd, capture_output=True, text=True)
-             
-             if result.returncode == 0:
+             if not _CONTAINER_ID_RE.fullmatch(target):
+                 return {"success": False, "error": f"Invalid container id: {target!r}"}
+             returncode, stderr = await _docker_call(
+                 lambda client: client.containers.get(target).kill(),
+                 "kill", target,
+             )
+             _invalidate_reads()
+
+             if returncode == 0:
                  return {"success": True, "details": f"Container {target} killed"}
              else:
-                 return {"success": False, "error": result.stderr}
+                 return {"success": False, "error": stderr}
 
         elif identifier_type == "pid":
             # Local kill
             pid = int(process_identifier)
             sig = "-9" if force else "-15"
-            cmd = ["kill", sig, str(pid)]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            returncode, _, stderr = await _run_process("kill", sig, str(pid))
+            _invalidate_reads()
+
+            if returncode == 0:
                  return {"success": True, "details": f"PID {pid} killed"}
             else:
-                 return {"success": False, "error": result.stderr}
+                 return {"success": False, "error": stderr}
         
         else:
             return {"success": False, "error": f"Unknown identifier type {identifier_type}"}
@@ -199,7 +458,8 @@ def terminate_process(
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-def execute_command(
+@rate_limited("high")
+async def execute_command(
     command: str,
     target_system: str,
     working_directory: str = "/tmp",
@@ -207,48 +467,46 @@ def execute_command(
     run_as_user: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Execute a real shell command.
+    Execute a real shell command on a pooled, long-lived shell worker.
     """
-    import subprocess
-    action_id = f"exec-{uuid.uuid4().hex[:8]}"
-    
     # Safety checks still apply even in real mode to prevent absolute disaster
-    dangerous_patterns = ["rm -rf /", "mkfs", ":(){:|:&};:"]
-    for pattern in dangerous_patterns:
-        if pattern in command:
-            return {"success": False, "error": f"Blocked dangerous pattern: {pattern}"}
+    match = _DANGER_RE.search(command)
+    if match:
+        return {"success": False, "error": f"Blocked dangerous pattern: {match.group()}"}
 
     if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
+        await _mock_delay()
         return {"success": True, "mock_mode": True, "stdout": "Mock output"}
 
     # REAL IMPLEMENTATION
     try:
-        # We run locally only for this demo
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=working_directory,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds
+        # We run locally only for this demo. The pool blocks on select(), so
+        # hand it to a worker thread to keep sibling tool calls concurrent.
+        exit_code, stdout, stderr, truncated = await asyncio.to_thread(
+            _SHELL_POOL.run, command, working_directory, timeout_seconds
         )
-        
-        return {
-            "action_id": action_id,
-            "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "exit_code": result.returncode,
-            "timestamp": datetime.now().isoformat()
-        }
+
+        return _pack({
+            "action_id": _new_action_id("exec"),
+            "success": exit_code == 0,
+            "stdout": stdout,
+            "stderr": stderr,
+            "exit_code": exit_code,
+            "truncated": truncated or None,
+            "timestamp": int(time.time())
+        })
 
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "Command timed out"}
     except Exception as e:
         return {"success": False, "error": str(e)}
+    finally:
+        _invalidate_reads()
 
-def verify_remediation(
+# Cache outside the limiter: hits cost no token, and denials are not cached.
+@ttl_cache(ttl=5, skip=is_rate_limited)
+@rate_limited("low")
+async def verify_remediation(
     action_id: str,
     verification_type: str = "status_check"
 ) -> Dict[str, Any]:
@@ -258,3 +516,75 @@ def verify_remediation(
         "verified": True,
         "message": "Verification logic pending state tracking implementation"
     }
+
+
+# =============================================================================
+# Batched dispatch
+# =============================================================================
+
+# Tools a plan may fan out to: ungated and idempotent or read-only only. One
+# confirmation of the plan must not stand in for the per-call confirmation of
+# gated tools (execute_command, isolate_system, terminate_process, ...), so
+# those stay separate calls.
+_PLAN_DISPATCH = {
+    "disable_credentials": disable_credentials,
+    "block_network_traffic": block_network_traffic,
+    "verify_remediation": verify_remediation,
+}
+
+
+async def _rejected(error: str) -> Dict[str, Any]:
+    return {"success": False, "error": error}
+
+
+@rate_limited("high")
+async def execute_plan(actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run several independent remediation actions concurrently.
+
+    Args:
+        actions: List of {"tool": <remediation tool name>, "args": {...}} entries,
+            where the tool is disable_credentials, block_network_traffic or
+            verify_remediation. Every action must be independent of the
+            others' outcome.
+
+    Returns:
+        {"success": True only if every action succeeded,
+         "results": per-action results in input order}
+    """
+    # The guardrail callback sees only the top-level ``actions`` argument, so
+    # screen every nested action before anything is dispatched.
+    blocked = find_blocked_command(actions)
+    if blocked:
+        return {"success": False, "error": f"Blocked by guardrail policy: command contains '{blocked}'"}
+
+    gated = set(get_confirmation_tools())
+
+    def _dispatch(action: Any) -> Awaitable[Dict[str, Any]]:
+        # Hand gather() the tool's own coroutine instead of awaiting it inside
+        # another coroutine frame.
+        if not isinstance(action, dict):
+            return _rejected("Each action must be an object")
+        name = action.get("tool")
+        tool = _PLAN_DISPATCH.get(name)
+        if tool is None or name in gated:
+            return _rejected(f"Unsupported plan tool: {name}")
+        args = action.get("args") or {}
+        if not isinstance(args, dict):
+            return _rejected("Action args must be an object")
+        return tool(**args)
+
+    outcomes = await asyncio.gather(
+        *(_dispatch(action) for action in actions), return_exceptions=True
+    )
+    results = []
+    for action, outcome in zip(actions, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = {"success": False, "error": str(outcome)}
+        tool_name = action.get("tool") if isinstance(action, dict) else None
+        results.append(_pack({"tool": tool_name, **outcome}))
+
+    return {
+        "success": all(result.get("success", result.get("verified", False)) for result in results),
+        "results": results,
+    }
@@ -1,56 +1,53 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import Counter
+
+
+_SEVERITY_WEIGHTS = {"critical": 0.35, "high": 0.22, "medium": 0.12, "low": 0.06}
+
+# Pressure weight by threshold bucket: below the first edge, >= each edge.
+_PRESSURE_WEIGHTS = (0.0, 0.07, 0.12, 0.2)
+_UTILIZATION_EDGES = (75.0, 85.0, 95.0)
+_METRIC_EDGES = {
+    "cpu_usage_percent": _UTILIZATION_EDGES,
+    "memory_usage_percent": _UTILIZATION_EDGES,
+    "disk_usage_percent": _UTILIZATION_EDGES,
+    "error_rate_percent": (1.0, 2.0, 5.0),
+    "request_p95_ms": (350.0, 700.0, 1200.0),
+}
+
+
+def _metric_pressure(samples: list[tuple[object, float]]) -> float:
+    total = 0.0
+    for name, value in samples:
+        edges = _METRIC_EDGES.get(name)
+        # NaN samples (Prometheus "NaN") carry no reading, so add no pressure;
+        # +Inf still lands in the top band.
+        if edges is not None and value == value:
+            total += _PRESSURE_WEIGHTS[bisect_right(edges, value)]
+    return total
+
 
 def score_anomaly(features: dict) -> float:
     metrics = features.get("metrics", {})
     findings = features.get("findings", [])
 
-    score = 0.0
-
     # Weight explicit anomaly findings from the system analyzer.
-    for finding in findings if isinstance(findings, list) else []:
-        if not isinstance(finding, dict):
-            continue
-        severity = str(finding.get("severity", "")).lower()
-        if severity == "critical":
-            score += 0.35
-        elif severity == "high":
-            score += 0.22
-        elif severity == "medium":
-            score += 0.12
-        elif severity == "low":
-            score += 0.06
+    severities = Counter(
+        str(finding.get("severity", "")).lower()
+        for finding in (findings if isinstance(findings, list) else [])
+        if isinstance(finding, dict)
+    )
+    score = sum(weight * severities[severity] for severity, weight in _SEVERITY_WEIGHTS.items())
 
     # Add metric pressure when metric values are elevated.
     series = metrics.get("series", []) if isinstance(metrics, dict) else []
-    for sample in series:
-        if not isinstance(sample, dict):
-            continue
-        name = sample.get("name")
-        latest = sample.get("latest")
-        if not isinstance(latest, (float, int)):
-            continue
-        value = float(latest)
-        if name in {"cpu_usage_percent", "memory_usage_percent", "disk_usage_percent"}:
-            if value >= 95:
-                score += 0.2
-            elif value >= 85:
-                score += 0.12
-            elif value >= 75:
-                score += 0.07
-        elif name == "error_rate_percent":
-            if value >= 5:
-                score += 0.2
-            elif value >= 2:
-                score += 0.12
-            elif value >= 1:
-                score += 0.07
-        elif name == "request_p95_ms":
-            if value >= 1200:
-                score += 0.2
-            elif value >= 700:
-                score += 0.12
-            elif value >= 350:
-                score += 0.07
+    samples = [
+        (sample.get("name"), float(sample["latest"]))
+        for sample in series
+        if isinstance(sample, dict) and isinstance(sample.get("latest"), (float, int))
+    ]
+    score += _metric_pressure(samples)
 
     return round(min(score, 1.0), 3)
@@ -1,3 +1,12 @@
-from .agent import thought_agent
+from typing import Any
 
 __all__ = ["thought_agent"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer building the agent until it is actually used.
+    if name in __all__:
+        from . import agent
+
+        return getattr(agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,12 @@
-from .agent import magistrate_agent
+from typing import Any
 
-__all__ = ["magistrate_agent"]
+__all__ = ["magistrate_agent", "get_magistrate_agent", "magistrate_tools"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer building the agent graph until the Magistrate is actually used.
+    if name in __all__:
+        from . import agent
+
+        return getattr(agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,9 +13,15 @@ Sub-agents:
 - Security Enforcer: Remediation execution
 """
 
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
 from google.adk.agents import Agent
 
 from config.settings import get_model_for_agent
+from shared.adk.lazy import lazy_module
 from agents.decision.security_magistrate.prompts import MAGISTRATE_INSTRUCTION, MAGISTRATE_DESCRIPTION
 from agents.decision.security_magistrate.tools_gemini_compat import (
     analyze_threat_signals,
@@ -30,35 +36,50 @@ from agents.decision.security_magistrate.tools_gemini_compat import (
 from shared.security_tools.reasoning import think
 
 # =============================================================================
-# Sub-Agents (direct imports — wired at module load time)
+# Sub-Agents (resolved on first access, not at import)
 # =============================================================================
-from agents.analysis.thought_agent.agent import thought_agent
-from agents.action.security_enforcer.agent import security_enforcer_agent
+# Importing a sub-agent builds its tools, model and clients, so the modules
+# are registered lazily and only executed when the Magistrate is first built.
+_LAZY_SUB_AGENTS = {
+    "thought_agent": lazy_module("agents.analysis.thought_agent.agent"),
+    "security_enforcer_agent": lazy_module("agents.action.security_enforcer.agent"),
+}
 
 
 # =============================================================================
 # Agent Configuration
 # =============================================================================
 
-magistrate_tools = [
+# Immutable so the registry cannot drift; the Agent takes its own list copy.
+magistrate_tools = (
     think,                    # Reasoning/memory cache
     analyze_threat_signals,   # Correlate signals
     assess_severity,          # Determine severity
     classify_attack_type,     # Identify attack type
     prioritize_actions,       # Rank threats
-]
-
-
-# Create the Magistrate agent
-magistrate_agent = Agent(
-    model=get_model_for_agent("magistrate"),
-    name="security_magistrate",
-    description=MAGISTRATE_DESCRIPTION,
-    instruction=MAGISTRATE_INSTRUCTION,
-    tools=magistrate_tools,
-    output_key="decision_verdict",
-    sub_agents=[thought_agent, security_enforcer_agent],
 )
 
 
-__all__ = ["magistrate_agent"]
+@lru_cache(maxsize=None)
+def get_magistrate_agent() -> Agent:
+    """Build the Magistrate agent (and its sub-agents) once, on first use."""
+    return Agent(
+        model=get_model_for_agent("magistrate"),
+        name="security_magistrate",
+        description=MAGISTRATE_DESCRIPTION,
+        instruction=MAGISTRATE_INSTRUCTION,
+        tools=magistrate_tools,
+        output_key="decision_verdict",
+        sub_agents=[__getattr__(name) for name in _LAZY_SUB_AGENTS],
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "magistrate_agent":
+        return get_magistrate_agent()
+    if name in _LAZY_SUB_AGENTS:
+        return getattr(_LAZY_SUB_AGENTS[name], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["magistrate_agent", "get_magistrate_agent", "magistrate_tools"]
@@ -7,60 +7,211 @@ TODO: For production, these tools would integrate with real threat intelligence,
 SIEM systems, and security databases.
 """
 
-import time
-import json
-from typing import List, Dict, Any, Optional
+import heapq
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple, Union
 
 from config.settings import MOCK_MODE, MOCK_DELAY_SECONDS
 from config.constants import SEVERITY_WEIGHTS, ATTACK_TYPE_DEFAULT_SEVERITY
 from shared.security.models import SeverityLevel, AttackType
 
 
+@dataclass(frozen=True, slots=True)
+class AnalysisResult:
+    """Correlation result of analyze_threat_signals (immutable; memoized)."""
+
+    status: str
+    signal_count: int
+    affected_systems: Tuple[str, ...]
+    signal_sources: Tuple[str, ...]
+    signal_types: Tuple[str, ...]
+    correlation_score: float
+    correlation_reasons: Tuple[str, ...]
+    attack_patterns_detected: Tuple[str, ...]
+    is_likely_real_attack: bool
+    needs_deep_reasoning: bool
+    recommendations: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ClassificationScore:
+    """One candidate attack type and its confidence."""
+
+    type: str
+    confidence: float
+
+
+@dataclass(frozen=True, slots=True)
+class AttackClassification:
+    """Result of classify_attack_type (immutable; memoized)."""
+
+    primary_attack_type: str
+    confidence: float
+    evidence: Tuple[str, ...]
+    all_classifications: Tuple[ClassificationScore, ...]
+    needs_further_investigation: bool
+
+
+# Result for an empty batch; immutable, so one instance serves every call.
+_NO_SIGNALS = AnalysisResult(
+    status="no_signals",
+    signal_count=0,
+    affected_systems=(),
+    signal_sources=(),
+    signal_types=(),
+    correlation_score=0.0,
+    correlation_reasons=(),
+    attack_patterns_detected=(),
+    is_likely_real_attack=False,
+    needs_deep_reasoning=False,
+    recommendations=("Request signals from monitoring agents",),
+)
+
+
+# Mock latency is fixed for the life of the process, so resolve it once here
+# instead of testing MOCK_MODE on every tool call.
+if MOCK_MODE and MOCK_DELAY_SECONDS > 0:
+    import time
+
+    def _mock_delay() -> None:
+        time.sleep(MOCK_DELAY_SECONDS)
+else:
+    def _mock_delay() -> None:
+        pass
+
+# Correlation score at which signals are treated as a likely real attack, and
+# the margin around it inside which the verdict is too close to call. Outside
+# the band the fast correlation is decisive and the Thought Agent round trip
+# can be skipped; inside it, deep reasoning is still requested.
+_LIKELY_ATTACK_THRESHOLD = 0.5
+_DEEP_REASONING_BUFFER = 0.2
+
+# Multi-signal attack patterns: (signal types that must all be present,
+# pattern name, correlation weight).
+_ATTACK_PATTERN_RULES = (
+    (frozenset({"suspicious_process", "c2_communication"}), "ransomware_pattern", 0.4),
+    (frozenset({"credential_anomaly", "lateral_movement"}), "credential_theft_and_movement", 0.4),
+    (frozenset({"data_exfiltration"}), "data_breach", 0.3),
+)
+
+
+def _single_signal_patterns() -> Dict[str, Tuple[Tuple[str, float], ...]]:
+    """Index the rules a single signal can satisfy on its own by signal type."""
+    patterns: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+    for required_signals, pattern, weight in _ATTACK_PATTERN_RULES:
+        if len(required_signals) == 1:
+            (signal_type,) = required_signals
+            patterns[signal_type] = patterns.get(signal_type, ()) + ((pattern, weight),)
+    return patterns
+
+
+_SINGLE_SIGNAL_PATTERNS = _single_signal_patterns()
+
+# Attack type -> (default severity, its score), folding the two config
+# lookups assess_severity needs into one.
+_ATTACK_TYPE_BASELINES = {
+    attack_type: (severity, SEVERITY_WEIGHTS.get(severity, 50))
+    for attack_type, severity in ATTACK_TYPE_DEFAULT_SEVERITY.items()
+}
+_DEFAULT_BASELINE = ("medium", SEVERITY_WEIGHTS.get("medium", 50))
+
+# Prioritization bonuses for actively spreading and data-loss threats.
+_SPREADING_BONUS = 20
+_DATA_LOSS_BONUS = 15
+_DATA_LOSS_ATTACK_TYPES = ("ransomware", "data_exfiltration")
+
+# Enum members resolved to their wire values once, for result building.
+_SEVERITY_VALUES = {member: member.value for member in SeverityLevel}
+_ATTACK_TYPE_VALUES = {member: member.value for member in AttackType}
+
+_RESPONSE_TIMES = {
+    SeverityLevel.CRITICAL: "Immediate (within minutes)",
+    SeverityLevel.HIGH: "Urgent (within 1 hour)",
+    SeverityLevel.MEDIUM: "Soon (within 4 hours)",
+    SeverityLevel.LOW: "Scheduled (within 24-48 hours)",
+}
+
+_THREAT_ACTIONS = {
+    "ransomware": "Isolate affected systems, disable network access, preserve evidence",
+    "data_exfiltration": "Block external connections, disable compromised accounts",
+    "credential_theft": "Rotate credentials, invalidate sessions, enable MFA",
+    "privilege_escalation": "Revoke elevated permissions, audit access logs",
+    "container_escape": "Terminate container, isolate host, audit other containers",
+    "cryptomining": "Terminate malicious processes, patch entry vector",
+    "lateral_movement": "Segment network, block inter-host SSH, audit credentials",
+}
+
+# Known miner binaries, matched as case-insensitive substrings of process names.
+_KNOWN_MINERS = ("xmrig", "minerd", "cpuminer", "ethminer", "phoenixminer")
+
+
 def analyze_threat_signals(
-    signals: List[Dict[str, Any]],
-    correlation_window_minutes: int = 30
-) -> Dict[str, Any]:
+    signals: List[Dict[str, Any]]
+) -> AnalysisResult:
     """
     Analyze and correlate multiple threat signals to identify patterns.
     
     This tool helps identify if multiple signals are related to the same attack
-    by looking for common affected systems, timing, and indicators.
+    by looking for common affected systems, sources, and signal types.
     
     Args:
         signals: List of threat signal dictionaries from monitoring agents
-        correlation_window_minutes: Time window to consider signals as related
         
     Returns:
-        Analysis results including correlations, patterns, and recommendations
+        AnalysisResult with correlations, patterns, and recommendations; its
+        status is "no_signals" when the batch is empty
     """
-    if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
+    _mock_delay()
     
     if not signals:
-        return {
-            "status": "no_signals",
-            "message": "No signals provided for analysis",
-            "correlated_groups": [],
-            "recommendations": ["Request signals from monitoring agents"]
-        }
-    
-    # Extract common affected systems
-    all_affected_systems = set()
-    all_sources = set()
-    signal_types = set()
-    
-    for signal in signals:
-        if isinstance(signal, dict):
-            all_affected_systems.update(signal.get("affected_systems", []))
-            all_sources.add(signal.get("source", "unknown"))
-            signal_types.add(signal.get("signal_type", "unknown"))
+        return _NO_SIGNALS
+
+    # A lone signal cannot correlate with anything: only single-signal
+    # patterns can apply, so skip the set building and the memo entirely.
+    if len(signals) == 1 and isinstance(signals[0], dict):
+        signal = signals[0]
+        signal_type = signal.get("signal_type", "unknown")
+        patterns = _SINGLE_SIGNAL_PATTERNS.get(signal_type, ())
+        return _analysis_result(
+            signal_count=1,
+            affected_systems=list(set(signal.get("affected_systems", []))),
+            sources=[signal.get("source", "unknown")],
+            signal_types=[signal_type],
+            correlation_score=sum(weight for _, weight in patterns),
+            correlation_reasons=[],
+            attack_patterns=[pattern for pattern, _ in patterns],
+        )
+
+    # Only source, signal_type and affected_systems feed the analysis, so a
+    # batch reduces to a hashable digest; re-sent batches hit the memo. This
+    # is the one pass that drops malformed (non-dict) entries.
+    digest = frozenset(
+        (
+            signal.get("source", "unknown"),
+            signal.get("signal_type", "unknown"),
+            frozenset(signal.get("affected_systems", [])),
+        )
+        for signal in signals
+        if isinstance(signal, dict)
+    )
+    return _correlate_signals(digest, len(signals))
+
+
+@lru_cache(maxsize=256)
+def _correlate_signals(digest: frozenset, signal_count: int) -> AnalysisResult:
+    """Correlate a canonicalized signal batch."""
+    # Extract common affected systems (the digest holds only valid signals)
+    all_affected_systems = set().union(*(affected for _, _, affected in digest))
+    all_sources = {source for source, _, _ in digest}
+    signal_types = {signal_type for _, signal_type, _ in digest}
     
     # Determine if signals are correlated
     correlation_score = 0.0
     correlation_reasons = []
     
     # Multiple signals affecting same systems suggests correlation
-    if len(signals) > 1 and len(all_affected_systems) < len(signals) * 2:
+    if signal_count > 1 and len(all_affected_systems) < signal_count * 2:
         correlation_score += 0.3
         correlation_reasons.append("Multiple signals affect overlapping systems")
     
@@ -71,34 +222,52 @@ def analyze_threat_signals(
     
     # Check for known attack patterns
     attack_patterns_detected = []
-    signal_type_set = signal_types
-    
-    if "suspicious_process" in signal_type_set and "c2_communication" in signal_type_set:
-        attack_patterns_detected.append("ransomware_pattern")
-        correlation_score += 0.4
-    
-    if "credential_anomaly" in signal_type_set and "lateral_movement" in signal_type_set:
-        attack_patterns_detected.append("credential_theft_and_movement")
-        correlation_score += 0.4
-    
-    if "data_exfiltration" in signal_type_set:
-        attack_patterns_detected.append("data_breach")
-        correlation_score += 0.3
-    
-    return {
-        "status": "analyzed",
-        "signal_count": len(signals),
-        "affected_systems": list(all_affected_systems),
-        "signal_sources": list(all_sources),
-        "signal_types": list(signal_types),
-        "correlation_score": min(correlation_score, 1.0),
-        "correlation_reasons": correlation_reasons,
-        "attack_patterns_detected": attack_patterns_detected,
-        "is_likely_real_attack": correlation_score >= 0.5,
-        "recommendations": _generate_analysis_recommendations(
-            correlation_score, attack_patterns_detected, list(all_affected_systems)
-        )
-    }
+    for required_signals, pattern, weight in _ATTACK_PATTERN_RULES:
+        if required_signals <= signal_types:
+            attack_patterns_detected.append(pattern)
+            correlation_score += weight
+    
+    return _analysis_result(
+        signal_count=signal_count,
+        affected_systems=list(all_affected_systems),
+        sources=list(all_sources),
+        signal_types=list(signal_types),
+        correlation_score=correlation_score,
+        correlation_reasons=correlation_reasons,
+        attack_patterns=attack_patterns_detected,
+    )
+
+
+def _analysis_result(
+    signal_count: int,
+    affected_systems: List[str],
+    sources: List[str],
+    signal_types: List[str],
+    correlation_score: float,
+    correlation_reasons: List[str],
+    attack_patterns: List[str],
+) -> AnalysisResult:
+    """Build the analyze_threat_signals result."""
+    return AnalysisResult(
+        status="analyzed",
+        signal_count=signal_count,
+        affected_systems=tuple(affected_systems),
+        signal_sources=tuple(sources),
+        signal_types=tuple(signal_types),
+        correlation_score=min(correlation_score, 1.0),
+        correlation_reasons=tuple(correlation_reasons),
+        attack_patterns_detected=tuple(attack_patterns),
+        is_likely_real_attack=correlation_score >= _LIKELY_ATTACK_THRESHOLD,
+        needs_deep_reasoning=(
+            abs(correlation_score - _LIKELY_ATTACK_THRESHOLD) < _DEEP_REASONING_BUFFER
+        ),
+        recommendations=tuple(_generate_analysis_recommendations(
+            correlation_score, attack_patterns, affected_systems
+        )),
+    )
+
+
+analyze_threat_signals.cache_clear = _correlate_signals.cache_clear
 
 
 def assess_severity(
@@ -128,12 +297,12 @@ def assess_severity(
     Returns:
         Severity assessment with level, score, and factors
     """
-    if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
+    _mock_delay()
     
     # Base severity from attack type
-    base_severity = ATTACK_TYPE_DEFAULT_SEVERITY.get(attack_type.lower(), "medium")
-    severity_score = SEVERITY_WEIGHTS.get(base_severity, 50)
+    base_severity, severity_score = _ATTACK_TYPE_BASELINES.get(
+        attack_type.lower(), _DEFAULT_BASELINE
+    )
     
     factors = [f"Base severity for {attack_type}: {base_severity}"]
     
@@ -171,7 +340,7 @@ def assess_severity(
         final_severity = SeverityLevel.LOW
     
     return {
-        "severity_level": final_severity.value,
+        "severity_level": _SEVERITY_VALUES[final_severity],
         "severity_score": min(severity_score, 100),
         "factors": factors,
         "requires_immediate_action": final_severity in [SeverityLevel.CRITICAL, SeverityLevel.HIGH],
@@ -180,52 +349,78 @@ def assess_severity(
 
 
 def classify_attack_type(
-    signal_types: List[str],
+    signal_types: Union[List[str], FrozenSet[str]],
     indicators: Dict[str, Any],
     process_names: Optional[List[str]] = None,
     network_behavior: Optional[str] = None
-) -> Dict[str, Any]:
+) -> AttackClassification:
     """
     Classify the type of attack based on signals and indicators.
     
     Args:
-        signal_types: List of signal types from monitoring agents
+        signal_types: Signal types from monitoring agents; a frozenset (for
+            example one already built by an in-process caller) is used as-is
         indicators: Technical indicators (IPs, hashes, behaviors)
         process_names: Optional list of suspicious process names detected
         network_behavior: Optional description of network behavior
         
     Returns:
-        Classification with attack type, confidence, and evidence
+        AttackClassification with attack type, confidence, and evidence
     """
-    if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
-    
+    _mock_delay()
+
+    # Only these indicators are consulted; network_behavior is informational.
+    args = (
+        frozenset(signal_types),
+        indicators.get("files_modified", 0),
+        indicators.get("file_extension_added"),
+        indicators.get("bytes_transferred", 0),
+        indicators.get("impossible_travel"),
+        tuple(process_names) if process_names else (),
+    )
+    try:
+        hash(args)
+    except TypeError:
+        # Unhashable indicator values cannot be memoized.
+        return _classify_signals.__wrapped__(*args)
+    return _classify_signals(*args)
+
+
+@lru_cache(maxsize=256)
+def _classify_signals(
+    signal_set: frozenset,
+    files_modified: Any,
+    file_extension_added: Any,
+    bytes_transferred: Any,
+    impossible_travel: Any,
+    process_names: tuple,
+) -> AttackClassification:
+    """Classify from the consulted inputs."""
     classifications = []
     evidence = []
     
-    signal_set = set(signal_types)
     
     # Check for ransomware indicators
     if "suspicious_process" in signal_set or "configuration_change" in signal_set:
-        if indicators.get("files_modified", 0) > 100:
+        if files_modified > 100:
             classifications.append((AttackType.RANSOMWARE, 0.9))
             evidence.append("Mass file modification detected")
-        if indicators.get("file_extension_added"):
+        if file_extension_added:
             classifications.append((AttackType.RANSOMWARE, 0.85))
-            evidence.append(f"New file extension: {indicators.get('file_extension_added')}")
+            evidence.append(f"New file extension: {file_extension_added}")
     
     # Check for data exfiltration
     if "data_exfiltration" in signal_set:
         classifications.append((AttackType.DATA_EXFILTRATION, 0.9))
         evidence.append("Unusual outbound data transfer detected")
-        if indicators.get("bytes_transferred", 0) > 100_000_000:  # 100MB
-            evidence.append(f"Large data transfer: {indicators.get('bytes_transferred')} bytes")
+        if bytes_transferred > 100_000_000:  # 100MB
+            evidence.append(f"Large data transfer: {bytes_transferred} bytes")
     
     # Check for credential theft
     if "credential_anomaly" in signal_set:
         classifications.append((AttackType.CREDENTIAL_THEFT, 0.85))
         evidence.append("Credential anomaly detected")
-        if indicators.get("impossible_travel"):
+        if impossible_travel:
             evidence.append("Impossible travel detected")
     
     # Check for privilege escalation
@@ -239,12 +434,13 @@ def classify_attack_type(
         evidence.append("Container escape attempt detected")
     
     # Check for cryptomining
-    if process_names:
-        known_miners = ["xmrig", "minerd", "cpuminer", "ethminer", "phoenixminer"]
-        for proc in process_names:
-            if any(miner in proc.lower() for miner in known_miners):
+    for proc in process_names:
+        lowered = proc.casefold()
+        for miner in _KNOWN_MINERS:
+            if miner in lowered:
                 classifications.append((AttackType.CRYPTOMINING, 0.95))
                 evidence.append(f"Known cryptominer process: {proc}")
+                break
     
     # Check for lateral movement
     if "lateral_movement" in signal_set:
@@ -261,31 +457,35 @@ def classify_attack_type(
         confidence = 0.5
         evidence.append("Unable to classify with high confidence")
     
-    return {
-        "primary_attack_type": primary_type.value,
-        "confidence": confidence,
-        "evidence": evidence,
-        "all_classifications": [
-            {"type": t.value, "confidence": c} for t, c in classifications
-        ],
-        "needs_further_investigation": confidence < 0.7,
-    }
+    return AttackClassification(
+        primary_attack_type=_ATTACK_TYPE_VALUES[primary_type],
+        confidence=confidence,
+        evidence=tuple(evidence),
+        all_classifications=tuple(
+            ClassificationScore(_ATTACK_TYPE_VALUES[t], c) for t, c in classifications
+        ),
+        needs_further_investigation=confidence < 0.7,
+    )
+
+
+classify_attack_type.cache_clear = _classify_signals.cache_clear
 
 
 def prioritize_actions(
-    threats: List[Dict[str, Any]]
+    threats: List[Dict[str, Any]],
+    top_k: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Prioritize multiple threats and determine order of remediation.
     
     Args:
         threats: List of threat assessments with severity and type
+        top_k: Optional limit; only the K highest-priority actions are returned
         
     Returns:
         Prioritized list of actions with reasoning
     """
-    if MOCK_MODE:
-        time.sleep(MOCK_DELAY_SECONDS)
+    _mock_delay()
     
     if not threats:
         return {
@@ -294,48 +494,28 @@ def prioritize_actions(
             "message": "No threats to prioritize"
         }
     
-    # Score each threat
-    scored_threats = []
-    for i, threat in enumerate(threats):
-        severity = threat.get("severity_level", "medium")
-        attack_type = threat.get("attack_type", "unknown")
-        affected_count = len(threat.get("affected_systems", []))
-        
-        score = SEVERITY_WEIGHTS.get(severity, 50)
-        
-        # Bonus for actively spreading threats
-        if threat.get("is_spreading"):
-            score += 20
-        
-        # Bonus for data-loss threats
-        if attack_type in ["ransomware", "data_exfiltration"]:
-            score += 15
-        
-        scored_threats.append({
-            "original_index": i,
-            "threat": threat,
-            "priority_score": score,
-        })
-    
-    # Sort by priority score (highest first)
-    scored_threats.sort(key=lambda x: x["priority_score"], reverse=True)
+    # Score each threat, then rank highest first (ties keep input order)
+    scores = _priority_scores(threats)
+    if top_k is not None and top_k < len(threats):
+        order = heapq.nlargest(max(top_k, 0), range(len(threats)), key=scores.__getitem__)
+    else:
+        order = sorted(range(len(threats)), key=scores.__getitem__, reverse=True)
     
     prioritized = []
-    for rank, item in enumerate(scored_threats, 1):
+    for rank, index in enumerate(order, 1):
+        threat = threats[index]
         prioritized.append({
             "priority_rank": rank,
-            "priority_score": item["priority_score"],
-            "threat": item["threat"],
-            "recommended_action": _recommend_action_for_threat(item["threat"]),
+            "priority_score": scores[index],
+            "threat": threat,
+            "recommended_action": _recommend_action_for_threat(threat),
         })
     
     return {
         "status": "prioritized",
         "total_threats": len(threats),
         "prioritized_actions": prioritized,
-        "immediate_action_count": sum(
-            1 for t in prioritized if t["priority_score"] >= 75
-        ),
+        "immediate_action_count": sum(1 for score in scores if score >= 75),
     }
 
 
@@ -343,6 +523,19 @@ def prioritize_actions(
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _priority_scores(threats: List[Dict[str, Any]]) -> List[int]:
+    """Severity weight plus bonuses for spreading and data-loss threats."""
+    scores = []
+    for threat in threats:
+        score = SEVERITY_WEIGHTS.get(threat.get("severity_level", "medium"), 50)
+        if threat.get("is_spreading"):
+            score += _SPREADING_BONUS
+        if threat.get("attack_type", "unknown") in _DATA_LOSS_ATTACK_TYPES:
+            score += _DATA_LOSS_BONUS
+        scores.append(score)
+    return scores
+
+
 def _generate_analysis_recommendations(
     correlation_score: float,
     attack_patterns: List[str],
@@ -373,27 +566,10 @@ def _generate_analysis_recommendations(
 
 def _get_response_time(severity: SeverityLevel) -> str:
     """Get recommended response time based on severity."""
-    response_times = {
-        SeverityLevel.CRITICAL: "Immediate (within minutes)",
-        SeverityLevel.HIGH: "Urgent (within 1 hour)",
-        SeverityLevel.MEDIUM: "Soon (within 4 hours)",
-        SeverityLevel.LOW: "Scheduled (within 24-48 hours)",
-    }
-    return response_times.get(severity, "As soon as possible")
+    return _RESPONSE_TIMES.get(severity, "As soon as possible")
 
 
 def _recommend_action_for_threat(threat: Dict[str, Any]) -> str:
     """Recommend specific action for a threat type."""
     attack_type = threat.get("attack_type", "unknown")
-    
-    action_map = {
-        "ransomware": "Isolate affected systems, disable network access, preserve evidence",
-        "data_exfiltration": "Block external connections, disable compromised accounts",
-        "credential_theft": "Rotate credentials, invalidate sessions, enable MFA",
-        "privilege_escalation": "Revoke elevated permissions, audit access logs",
-        "container_escape": "Terminate container, isolate host, audit other containers",
-        "cryptomining": "Terminate malicious processes, patch entry vector",
-        "lateral_movement": "Segment network, block inter-host SSH, audit credentials",
-    }
-    
-    return action_map.get(attack_type, "Investigate and contain as appropriate")
+    return _THREAT_ACTIONS.get(attack_type, "Investigate and contain as appropriate")
@@ -4,26 +4,33 @@ JSON wrapper for magistrate tools - fixes Gemini compatibility.
 Gemini rejects function parameters with Dict[str, Any] type hints because they
 generate OpenAPI schemas with `additionalProperties`, which isn't supported.
 
-This module wraps all magistrate tools to accept/return JSON strings instead.
+This module wraps all magistrate tools to accept/return JSON strings instead
+(result dataclasses are serialized field by field). The wrapped tools are
+coroutines that run the synchronous tool body in a worker thread.
 """
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import functools
 import inspect
 import json
 from typing import Any, Callable
 
 from agents.decision.security_magistrate import tools as raw_tools
+from shared.utils import serialization
 
 
 def _deep_parse(value: Any) -> Any:
     """Recursively parse JSON strings into Python objects."""
-    if isinstance(value, str) and value.strip() and value.strip()[0] in '[{':
+    if isinstance(value, str):
+        if value.lstrip()[:1] not in ('[', '{'):
+            return value
         try:
-            parsed = json.loads(value)
-            return _deep_parse(parsed)
-        except (json.JSONDecodeError, ValueError):
+            parsed = serialization.loads(value)
+        except ValueError:
             return value
+        return _deep_parse(parsed)
     if isinstance(value, list):
         return [_deep_parse(item) for item in value]
     if isinstance(value, dict):
@@ -31,34 +38,54 @@ def _deep_parse(value: Any) -> Any:
     return value
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize the tools' immutable result dataclasses."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _is_structured(annotation: Any) -> bool:
+    """Whether an annotation is a Dict/List type that travels as JSON text."""
+    return annotation is not inspect.Parameter.empty and (
+        'Dict' in str(annotation) or 'List' in str(annotation)
+    )
+
+
 def _json_wrapper(func: Callable) -> Callable:
     """Wrap a tool to accept/return JSON strings instead of dicts/lists."""
+    orig_sig = inspect.signature(func)
+    # Resolved once per tool: only Dict/List parameters arrive as JSON text,
+    # and a tool declared to return a str needs no serialization.
+    json_params = frozenset(
+        name for name, param in orig_sig.parameters.items() if _is_structured(param.annotation)
+    )
+    returns_str = orig_sig.return_annotation is str
+
     @functools.wraps(func)
-    def wrapped(**kwargs: Any) -> str:
+    async def wrapped(**kwargs: Any) -> str:
         # Parse JSON string kwargs back to Python objects (deep)
-        parsed_kwargs = {}
-        for key, value in kwargs.items():
-            parsed_kwargs[key] = _deep_parse(value)
+        for key in json_params.intersection(kwargs):
+            kwargs[key] = _deep_parse(kwargs[key])
 
-        # Call original tool
-        result = func(**parsed_kwargs)
+        # Call original tool off the event loop: tool bodies may block (mock
+        # latency today, SIEM/threat-intel I/O later), and ADK gathers the
+        # function calls of one model turn concurrently.
+        result = await asyncio.to_thread(func, **kwargs)
 
         # Serialize result to JSON if it's not already a string
-        if not isinstance(result, str):
-            return json.dumps(result)
-        return result
+        if returns_str:
+            return result
+        return json.dumps(result, default=_json_default)
 
     # Rewrite signature: replace Dict/List annotations with str
-    orig_sig = inspect.signature(func)
-    new_params = []
-    for param in orig_sig.parameters.values():
-        ann = param.annotation
-        if ann is not inspect.Parameter.empty and ('Dict' in str(ann) or 'List' in str(ann)):
-            param = param.replace(annotation=str)
-        new_params.append(param)
+    new_params = [
+        param.replace(annotation=str) if name in json_params else param
+        for name, param in orig_sig.parameters.items()
+    ]
     wrapped.__signature__ = orig_sig.replace(parameters=new_params, return_annotation=str)
     wrapped.__annotations__ = {
-        k: str if 'Dict' in str(v) or 'List' in str(v) else v
+        k: str if _is_structured(v) else v
         for k, v in (func.__annotations__ or {}).items()
     }
 
@@ -1,153 +1,172 @@
 from __future__ import annotations
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from itertools import islice
 import socket
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+from config.settings import SCOPE_SCAN_CACHE_TTL_SECONDS
 from shared.tools.asset_discovery_tools import discover_runtime_assets
 from shared.tools.cloud_tools import fetch_cloud_inventory
 from shared.tools.kubernetes_tools import get_cluster_health
+from shared.utils.cache import ttl_cache
 
 
-def _runtime_assets(discovery: Dict[str, Any], max_assets: int) -> List[Dict[str, Any]]:
+# Field order and defaults shared by every asset record. Each record is built
+# as ``{**_ASSET_TEMPLATE, ...}`` so overrides keep this key order; the empty
+# lists are shared between records and are never mutated in place.
+_ASSET_TEMPLATE: Dict[str, Any] = {
+    "asset_id": "",
+    "asset_name": "",
+    "asset_type": "important",
+    "asset_category": "",
+    "ip_address": "",
+    "hostname": "",
+    "operating_system": "",
+    "services": [],
+    "owner": "platform",
+    "business_criticality": "medium",
+    "data_sensitivity": "internal",
+    "dependencies": [],
+    "upstream_dependencies": [],
+    "tags": [],
+    "last_scanned": "",
+    "status": "active",
+}
+
+
+# Constant tag sets, shared by every asset of a kind (tuples: never mutated).
+_SERVICE_TAGS = ("systemd", "runtime")
+_CONTAINER_TAGS = ("docker", "runtime")
+_LISTENER_TAGS = ("port", "listener")
+
+
+def _walk(data: Any, *path: str, default: Any = None) -> Any:
+    """Follow ``path`` through nested dicts; ``default`` if any step is missing."""
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def _runtime_assets(discovery: Dict[str, Any], max_assets: int, scanned_at: str) -> List[Dict[str, Any]]:
+    # discover_runtime_assets parses unit, container and listener address
+    # fields from command output, so they are already str; only fields that
+    # can be None or non-str upstream (e.g. listener process) are coerced.
     assets: List[Dict[str, Any]] = []
     host = discovery.get("host", {}) if isinstance(discovery, dict) else {}
     hostname = socket.gethostname()
+    runtime = {**_ASSET_TEMPLATE, "hostname": hostname, "last_scanned": scanned_at}
+    per_kind = max_assets // 3
     assets.append(
         {
+            **runtime,
             "asset_id": f"host-{hostname}",
             "asset_name": hostname,
             "asset_type": "critical",
             "asset_category": "infrastructure",
-            "ip_address": "",
-            "hostname": hostname,
             "operating_system": f"{host.get('platform', 'unknown')} {host.get('platform_release', '')}".strip(),
-            "services": [],
-            "owner": "platform",
-            "business_criticality": "medium",
-            "data_sensitivity": "internal",
-            "dependencies": [],
-            "upstream_dependencies": [],
             "tags": [str(discovery.get("runtime_profile", "unknown")), "host"],
-            "last_scanned": datetime.now(UTC).isoformat(),
-            "status": "active",
         }
     )
 
-    for service in discovery.get("systemd", {}).get("running_services", [])[: max_assets // 3]:
+    for service in islice(_walk(discovery, "systemd", "running_services", default=()), per_kind):
         if not isinstance(service, dict):
             continue
-        unit = str(service.get("unit", "unknown"))
+        unit = service.get("unit", "unknown")
         assets.append(
             {
+                **runtime,
                 "asset_id": f"service-{unit}",
                 "asset_name": unit,
-                "asset_type": "important",
                 "asset_category": "service",
-                "ip_address": "",
-                "hostname": hostname,
-                "operating_system": "",
                 "services": [unit],
                 "owner": "ops",
-                "business_criticality": "medium",
-                "data_sensitivity": "internal",
-                "dependencies": [],
-                "upstream_dependencies": [],
-                "tags": ["systemd", "runtime"],
-                "last_scanned": datetime.now(UTC).isoformat(),
-                "status": "active",
+                "tags": _SERVICE_TAGS,
             }
         )
 
-    for container in discovery.get("docker", {}).get("running_containers", [])[: max_assets // 3]:
+    for container in islice(_walk(discovery, "docker", "running_containers", default=()), per_kind):
         if not isinstance(container, dict):
             continue
-        container_name = str(container.get("name", "container"))
+        container_name = container.get("name", "container")
         assets.append(
             {
+                **runtime,
                 "asset_id": f"container-{container.get('id', container_name)}",
                 "asset_name": container_name,
-                "asset_type": "important",
                 "asset_category": "container",
-                "ip_address": "",
-                "hostname": hostname,
-                "operating_system": "",
-                "services": [str(container.get("image", ""))],
-                "owner": "platform",
-                "business_criticality": "medium",
-                "data_sensitivity": "internal",
-                "dependencies": [],
-                "upstream_dependencies": [],
-                "tags": ["docker", "runtime"],
-                "last_scanned": datetime.now(UTC).isoformat(),
-                "status": "active",
+                "services": [container.get("image", "")],
+                "tags": _CONTAINER_TAGS,
             }
         )
 
-    for listener in discovery.get("open_ports", {}).get("listeners", [])[: max_assets // 3]:
+    seen_listeners: set[tuple[int, str]] = set()
+    for listener in islice(_walk(discovery, "open_ports", "listeners", default=()), per_kind):
         if not isinstance(listener, dict):
             continue
         port = listener.get("port")
         if not isinstance(port, int):
             continue
         process = str(listener.get("process", "unknown"))
+        # ss/lsof list a socket per address family; keep one asset per
+        # (port, process) so runtime asset keys are unique by construction.
+        if (port, process) in seen_listeners:
+            continue
+        seen_listeners.add((port, process))
         assets.append(
             {
+                **runtime,
                 "asset_id": f"port-{port}-{process}",
                 "asset_name": f"{process}:{port}",
                 "asset_type": "external",
                 "asset_category": "network",
-                "ip_address": str(listener.get("local_address", "")),
-                "hostname": hostname,
-                "operating_system": "",
+                "ip_address": listener.get("local_address", ""),
                 "services": [f"{listener.get('protocol', 'tcp')}:{port}"],
                 "owner": "network",
-                "business_criticality": "medium",
-                "data_sensitivity": "internal",
-                "dependencies": [],
-                "upstream_dependencies": [],
-                "tags": ["port", "listener"],
-                "last_scanned": datetime.now(UTC).isoformat(),
-                "status": "active",
+                "tags": _LISTENER_TAGS,
             }
         )
 
     return assets[:max_assets]
 
 
-def _cloud_assets(cloud_inventory: Dict[str, Any], max_assets: int) -> List[Dict[str, Any]]:
+def _cloud_assets(cloud_inventory: Dict[str, Any], max_assets: int, scanned_at: str) -> List[Dict[str, Any]]:
     assets: List[Dict[str, Any]] = []
-    for cloud_asset in cloud_inventory.get("assets", [])[:max_assets]:
+    for cloud_asset in islice(cloud_inventory.get("assets", []), max_assets):
         if not isinstance(cloud_asset, dict):
             continue
         asset_name = str(cloud_asset.get("asset_name", cloud_asset.get("asset_id", "cloud-asset")))
+        provider = str(cloud_asset.get("provider", "cloud"))
         assets.append(
             {
+                **_ASSET_TEMPLATE,
                 "asset_id": str(cloud_asset.get("asset_id", asset_name)),
                 "asset_name": asset_name,
-                "asset_type": "important",
                 "asset_category": str(cloud_asset.get("asset_type", "cloud")),
                 "ip_address": str(cloud_asset.get("ip_address", "")),
-                "hostname": "",
-                "operating_system": "",
-                "services": [],
-                "owner": str(cloud_asset.get("provider", "cloud")),
-                "business_criticality": "medium",
-                "data_sensitivity": "internal",
-                "dependencies": [],
-                "upstream_dependencies": [],
-                "tags": [str(cloud_asset.get("provider", "cloud")), "cloud"],
-                "last_scanned": datetime.now(UTC).isoformat(),
+                "owner": provider,
+                "tags": [provider, "cloud"],
+                "last_scanned": scanned_at,
                 "status": str(cloud_asset.get("status", "active")),
             }
         )
     return assets
 
 
+# Several agents in one pipeline run ask for the same inventory within seconds
+# of each other; they share one scan.
+@ttl_cache(ttl=SCOPE_SCAN_CACHE_TTL_SECONDS, maxsize=16)
 def collect_scope_targets(max_processes: int = 200, max_assets: int = 500) -> Dict[str, Any]:
     """
     Build a consolidated asset inventory from runtime, Kubernetes, and cloud sources.
     Each source is optional; failures are recorded and do not stop the overall scan.
+    Repeat calls within a short window reuse the previous result.
     """
     runtime_status = "ok"
     cloud_status = "ok"
@@ -158,15 +177,22 @@ def collect_scope_targets(max_processes: int = 200, max_assets: int = 500) -> Di
     cloud_data: Dict[str, Any] = {}
     cluster_data: Dict[str, Any] = {}
 
+    # The three sources are independent and I/O bound: fetch them together
+    # so the scan takes as long as the slowest source, not their sum.
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="scope-scan") as executor:
+        runtime_future = executor.submit(discover_runtime_assets, max_processes=max_processes)
+        cloud_future = executor.submit(fetch_cloud_inventory)
+        cluster_future = executor.submit(get_cluster_health)
+
     try:
-        runtime_data = discover_runtime_assets(max_processes=max_processes)
+        runtime_data = runtime_future.result()
     except Exception as exc:
         runtime_status = "error"
         notes.append(f"runtime discovery failed: {exc}")
 
     try:
-        cloud_data = fetch_cloud_inventory()
-        unavailable = cloud_data.get("summary", {}).get("providers_unavailable", [])
+        cloud_data = cloud_future.result()
+        unavailable = _walk(cloud_data, "summary", "providers_unavailable", default=())
         if unavailable:
             cloud_status = "partial"
             notes.append(f"cloud providers unavailable: {', '.join(unavailable)}")
@@ -175,57 +201,58 @@ def collect_scope_targets(max_processes: int = 200, max_assets: int = 500) -> Di
         notes.append(f"cloud inventory failed: {exc}")
 
     try:
-        cluster_data = get_cluster_health()
+        cluster_data = cluster_future.result()
         if cluster_data.get("status") in {"unknown", "degraded"}:
             kubernetes_status = "partial"
     except Exception as exc:
         kubernetes_status = "error"
         notes.append(f"kubernetes health discovery failed: {exc}")
 
+    # One timestamp for the whole scan: every asset and the summary share it.
+    # The epoch form spares numeric consumers from re-parsing the ISO string.
+    scan_time = datetime.now(UTC)
+    scanned_at = scan_time.isoformat()
     assets: List[Dict[str, Any]] = []
     if runtime_data:
-        assets.extend(_runtime_assets(runtime_data, max_assets=max_assets))
-    if cloud_data:
-        assets.extend(_cloud_assets(cloud_data, max_assets=max_assets))
+        assets.extend(_runtime_assets(runtime_data, max_assets=max_assets, scanned_at=scanned_at))
+    cloud_assets = _cloud_assets(cloud_data, max_assets=max_assets, scanned_at=scanned_at) if cloud_data else []
+    assets.extend(cloud_assets)
     if cluster_data:
         cluster_name = str(cluster_data.get("cluster", "unknown-cluster"))
         assets.append(
             {
+                **_ASSET_TEMPLATE,
                 "asset_id": f"k8s-cluster-{cluster_name}",
                 "asset_name": cluster_name,
                 "asset_type": "critical",
                 "asset_category": "kubernetes",
-                "ip_address": "",
-                "hostname": "",
-                "operating_system": "",
-                "services": [],
-                "owner": "platform",
                 "business_criticality": "high",
-                "data_sensitivity": "internal",
-                "dependencies": [],
-                "upstream_dependencies": [],
                 "tags": ["kubernetes", str(cluster_data.get("status", "unknown"))],
-                "last_scanned": datetime.now(UTC).isoformat(),
+                "last_scanned": scanned_at,
                 "status": "active" if cluster_data.get("status") == "ok" else "degraded",
             }
         )
 
-    deduped_assets = list(
-        {
-            (
-                str(asset.get("asset_id", "")),
-                str(asset.get("asset_name", "")),
-                str(asset.get("asset_category", "")),
-            ): asset
-            for asset in assets
-        }.values()
-    )[:max_assets]
+    # A repeated (id, name, category) keeps its first position but takes the
+    # last record, and only the first max_assets distinct keys are kept. Past
+    # that point the pass only refreshes keys it already holds.
+    deduped: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for asset in assets:
+        key = (
+            str(asset.get("asset_id", "")),
+            str(asset.get("asset_name", "")),
+            str(asset.get("asset_category", "")),
+        )
+        if key in deduped or len(deduped) < max_assets:
+            deduped[key] = asset
+    deduped_assets = list(deduped.values())
+    asset_types = Counter(asset.get("asset_type") for asset in deduped_assets)
 
     classification_counts = {
-        "critical_assets": len([asset for asset in deduped_assets if asset.get("asset_type") == "critical"]),
-        "important_assets": len([asset for asset in deduped_assets if asset.get("asset_type") == "important"]),
-        "supporting_assets": len([asset for asset in deduped_assets if asset.get("asset_type") == "supporting"]),
-        "external_assets": len([asset for asset in deduped_assets if asset.get("asset_type") == "external"]),
+        "critical_assets": asset_types["critical"],
+        "important_assets": asset_types["important"],
+        "supporting_assets": asset_types["supporting"],
+        "external_assets": asset_types["external"],
     }
 
     return {
@@ -233,7 +260,8 @@ def collect_scope_targets(max_processes: int = 200, max_assets: int = 500) -> Di
         "summary": {
             "total_assets": len(deduped_assets),
             **classification_counts,
-            "scan_timestamp": datetime.now(UTC).isoformat(),
+            "scan_timestamp": scanned_at,
+            "scan_epoch": scan_time.timestamp(),
         },
         "sources": {
             "runtime": runtime_status,
@@ -243,7 +271,7 @@ def collect_scope_targets(max_processes: int = 200, max_assets: int = 500) -> Di
         "coverage": {
             "monitoring_targets": len(runtime_data.get("monitoring_targets", [])),
             "cloud_assets": len(cloud_data.get("assets", [])),
-            "kubernetes_nodes_total": cluster_data.get("nodes", {}).get("total", 0) if cluster_data else 0,
+            "kubernetes_nodes_total": _walk(cluster_data, "nodes", "total", default=0),
         },
         "notes": notes[:20],
     }
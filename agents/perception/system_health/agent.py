@@ -5,6 +5,7 @@ from shared.adk.observability import (
     after_model_callback,
     after_tool_callback,
     before_tool_callback,
+    on_model_error_callback,
     on_tool_error_callback,
 )
 from config.settings import get_model_for_agent
@@ -23,4 +24,5 @@ agent = Agent(
     after_tool_callback=after_tool_callback,
     on_tool_error_callback=on_tool_error_callback,
     after_model_callback=after_model_callback,
+    on_model_error_callback=on_model_error_callback,
 )
@@ -1,7 +1,6 @@
-from shared.models.contracts import SystemHealthReport
+from shared.models.contracts import SYSTEM_HEALTH_REPORT_FIELDS
 
 DESCRIPTION = "Tracks system health metrics and identifies degradation."
-REPORT_FIELDS = ", ".join(SystemHealthReport.model_fields.keys())
 
 INSTRUCTION = (
     "You are the system health agent in the perception layer. "
@@ -9,7 +8,7 @@ INSTRUCTION = (
     "Then call `get_cluster_health` and `fetch_metrics`. "
     "Finally, call `analyze_local_system` to evaluate service-level monitoring gaps and cybersecurity anomalies. "
     "Return JSON only and conform to the SystemHealthReport contract fields: "
-    f"{REPORT_FIELDS}. "
+    f"{SYSTEM_HEALTH_REPORT_FIELDS}. "
     "In key_signals, report only metric names returned by tools (exact names) and latest values. "
     "Do not infer or relabel unavailable metrics. "
     "Set telemetry_source to live, mock, mixed, or unknown based on tool outputs. "
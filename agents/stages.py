@@ -6,13 +6,24 @@ replaces the old LLM-delegated root agent.
 
 Pipeline order:
   1. perception_stage  (ParallelAgent: scope_scanner ∥ system_health)
-  2. analysis_stage    (ParallelAgent: anomaly_detector ∥ vulnerability_assessor ∥ network_monitor)
+  2. analysis_stage    (MemoizedParallelAgent: anomaly_detector ∥ vulnerability_assessor ∥ network_monitor)
   3. security_magistrate (Agent: decision + delegation to thought/enforcer)
 """
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+from collections import OrderedDict
+from typing import Any, AsyncGenerator
 from google.adk.agents import SequentialAgent, ParallelAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+try:  # Optional: faster non-cryptographic fingerprint for large stage inputs.
+    import xxhash
+except ImportError:  # xxhash is not a hard dependency
+    xxhash = None
+
+from config.settings import ANALYSIS_STAGE_CACHE
 
 # ----- Perception layer agents -----
 from agents.perception.scope_scanner.agent import agent as scope_scanner_agent
@@ -30,25 +41,89 @@ from agents.decision.security_magistrate.agent import magistrate_agent
 # =============================================================================
 # State key defaults — pre-seeded so template resolution never fails
 # =============================================================================
+PENDING_STATE_VALUE = "(not yet available)"
+
 PIPELINE_STATE_DEFAULTS: dict[str, str] = {
-    "perception_scope": "(not yet available)",
-    "perception_health": "(not yet available)",
-    "analysis_anomalies": "(not yet available)",
-    "analysis_vulnerabilities": "(not yet available)",
-    "analysis_network": "(not yet available)",
+    "perception_scope": PENDING_STATE_VALUE,
+    "perception_health": PENDING_STATE_VALUE,
+    "analysis_anomalies": PENDING_STATE_VALUE,
+    "analysis_vulnerabilities": PENDING_STATE_VALUE,
+    "analysis_network": PENDING_STATE_VALUE,
     "decision_verdict": "",
     "enforcement_result": "",
 }
 
 
+_STATE_DEFAULT_ITEMS = tuple(PIPELINE_STATE_DEFAULTS.items())
+
+# Set once the defaults are in the session state, which persists across turns.
+_STATE_SEEDED_KEY = "_pipeline_state_seeded"
+
+
 def _seed_state(callback_context: Any) -> None:
     """Ensure all pipeline state keys exist with defaults before any agent runs."""
     state = getattr(callback_context, "state", None)
-    if state is None:
+    if state is None or state.get(_STATE_SEEDED_KEY):
         return
-    for key, default in PIPELINE_STATE_DEFAULTS.items():
+    for key, default in _STATE_DEFAULT_ITEMS:
         if state.get(key) is None:
             state[key] = default
+    state[_STATE_SEEDED_KEY] = True
+
+
+# =============================================================================
+# Analysis result cache — opt-in (ADK_STAGE_CACHE) for dev and replay runs
+# =============================================================================
+_ANALYSIS_INPUT_KEYS = ("perception_scope", "perception_health")
+_ANALYSIS_OUTPUT_KEYS = ("analysis_anomalies", "analysis_vulnerabilities", "analysis_network")
+_ANALYSIS_CACHE_MAX_ENTRIES = 32
+_analysis_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+def _analysis_cache_key(state: Any) -> str:
+    digest = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    for key in _ANALYSIS_INPUT_KEYS:
+        digest.update(str(state.get(key, "")).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class MemoizedParallelAgent(ParallelAgent):
+    """ParallelAgent that replays earlier outputs when its inputs repeat.
+
+    With ``ANALYSIS_STAGE_CACHE`` on, a run whose perception outputs match an
+    earlier run in this process writes the stored analysis outputs back to
+    state in a single event instead of running the sub-agents.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        if not ANALYSIS_STAGE_CACHE:
+            async for event in super()._run_async_impl(ctx):
+                yield event
+            return
+
+        state = ctx.session.state
+        key = _analysis_cache_key(state)
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                actions=EventActions(state_delta=dict(cached)),
+            )
+            return
+
+        async for event in super()._run_async_impl(ctx):
+            yield event
+
+        # The runner has applied every sub-agent event to the session by now.
+        outputs = {name: state.get(name) for name in _ANALYSIS_OUTPUT_KEYS}
+        if all(value not in (None, PENDING_STATE_VALUE) for value in outputs.values()):
+            _analysis_cache[key] = outputs
+            if len(_analysis_cache) > _ANALYSIS_CACHE_MAX_ENTRIES:
+                _analysis_cache.popitem(last=False)
 
 
 # =============================================================================
@@ -62,7 +137,7 @@ perception_stage = ParallelAgent(
 # =============================================================================
 # Stage 2 — Analysis (parallel)
 # =============================================================================
-analysis_stage = ParallelAgent(
+analysis_stage = MemoizedParallelAgent(
     name="analysis_stage",
     sub_agents=[anomaly_detector_agent, vulnerability_assessor_agent, network_monitor_agent],
 )
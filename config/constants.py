@@ -8,6 +8,9 @@ For runtime/deployment config, see config.settings.
 """
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Any, Mapping
+
 
 # =============================================================================
 # SEVERITY CONFIGURATION
@@ -46,7 +49,8 @@ ATTACK_TYPE_DEFAULT_SEVERITY: dict[str, str] = {
 # REMEDIATION ACTIONS
 # =============================================================================
 
-REMEDIATION_ACTIONS: dict[str, dict] = {
+# Read-only: shared by every caller, so neither level may be mutated.
+REMEDIATION_ACTIONS: Mapping[str, Mapping[str, Any]] = {
     "disable_credentials": {
         "description": "Disable compromised user credentials",
         "risk_level": "medium",
@@ -78,6 +82,12 @@ REMEDIATION_ACTIONS: dict[str, dict] = {
         "reversible": False,
     },
 }
+REMEDIATION_ACTIONS = MappingProxyType(
+    {name: MappingProxyType(spec) for name, spec in REMEDIATION_ACTIONS.items()}
+)
+
+# Action names, for membership checks
+ACTION_NAMES: frozenset[str] = frozenset(REMEDIATION_ACTIONS)
 
 
 # =============================================================================
@@ -9,13 +9,14 @@ For secrets and API keys, see .env.
 """
 from __future__ import annotations
 
+import logging
 import os
 from functools import lru_cache
 from typing import Any
 
-from dotenv import load_dotenv
+from shared.utils.env import load_env
 
-load_dotenv()
+load_env()
 
 
 # =============================================================================
@@ -65,30 +66,63 @@ def app_name() -> str:
 LOG_LEVEL: str = os.getenv("SECURITY_AGENTS_LOG_LEVEL", "INFO")
 
 
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+# Replay analysis-stage results when perception output repeats (dev/replay
+# only: a hit also skips the live checks the analysis agents would run)
+ANALYSIS_STAGE_CACHE: bool = os.getenv("ADK_STAGE_CACHE", "false").lower() == "true"
+
+
+# =============================================================================
+# SCOPE SCANNING
+# =============================================================================
+
+# How long a scope scan result is reused for identical requests (0 disables)
+SCOPE_SCAN_CACHE_TTL_SECONDS: float = float(os.getenv("SCOPE_SCAN_CACHE_TTL_SECONDS", "30"))
+
+
 # =============================================================================
 # MODEL FACTORY
 # =============================================================================
 
+# LiteLLM limits for each ZAI model. One client is shared by every agent on
+# that model, so the limits are a joint budget; defaults are the former
+# per-agent values (5 / 5000 / 40) times the widest ParallelAgent stage
+# (3 siblings), keeping that stage's throughput unchanged.
+_ZAI_API_KEY: str | None = os.getenv("ZAI_API_KEY")
+_ZAI_LITELLM_PARAMS: dict[str, int] = {
+    "max_parallel_requests": int(os.getenv("ZAI_MAX_PARALLEL", "15")),
+    "tpm_limit": int(os.getenv("ZAI_TPM_LIMIT", "15000")),
+    "rpm_limit": int(os.getenv("ZAI_RPM_LIMIT", "120")),
+}
+
+
 def get_model_for_agent(agent_name: str) -> Any:
     """Return a model instance for the given agent.
 
     For ZAI provider, returns a LiteLlm wrapper.
     For Gemini provider, returns the model name string (ADK resolves it).
+    Agents configured with the same model share one client, so they share
+    its connection pool and rate limits.
     """
     model_name = AGENT_MODELS.get(agent_name.lower(), DEFAULT_MODEL)
 
     if MODEL_PROVIDER == "zai":
-        from google.adk.models.lite_llm import LiteLlm
-
-        return LiteLlm(
-            model=model_name,
-            api_key=os.getenv("ZAI_API_KEY"),
-            litellm_params={
-                "max_parallel_requests": 5,
-                "tpm_limit": 5000,
-                "rpm_limit": 40,
-            },
-        )
+        return _zai_model(model_name)
 
     # Gemini models use string directly
     return model_name
+
+
+@lru_cache(maxsize=None)
+def _zai_model(model_name: str) -> Any:
+    """Build the process-wide LiteLlm client for ``model_name``."""
+    from google.adk.models.lite_llm import LiteLlm
+
+    if not _ZAI_API_KEY:
+        logging.getLogger("config.settings").warning(
+            "ZAI_API_KEY is not set; requests to %s will fail to authenticate", model_name
+        )
+    return LiteLlm(model=model_name, api_key=_ZAI_API_KEY, litellm_params=_ZAI_LITELLM_PARAMS)
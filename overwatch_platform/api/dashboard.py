@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import html
 import json
+import re
 import sqlite3
 from pathlib import Path
 from typing import Any
@@ -19,6 +20,9 @@ DEFAULT_DB = ROOT_DIR / "data" / "overwatch.db"
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# A whole agent output wrapped in a Markdown code fence (```json ... ```)
+_FENCE_RE = re.compile(r"\A\s*```[^\n]*\n(.*?)\n?```\s*\Z", re.DOTALL)
+
 
 def _connect(db_path: Path | None = None) -> sqlite3.Connection:
     path = db_path or DEFAULT_DB
@@ -816,10 +820,11 @@ def _render_findings(raw: str, label: str) -> str:
     if not raw:
         return '<p class="empty">No findings</p>'
 
-    # Try to parse as JSON array
+    # Try to parse as JSON array, unwrapping a fenced block first
     findings = []
+    fenced = _FENCE_RE.match(raw)
     try:
-        parsed = json.loads(raw)
+        parsed = json.loads(fenced.group(1) if fenced else raw)
         if isinstance(parsed, list):
             findings = parsed
         elif isinstance(parsed, dict):
@@ -6,41 +6,75 @@ which is the correct approach for the deterministic pipeline architecture.
 """
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from typing import Any
 
-from agents.stages import secops_pipeline
+from agents.stages import PENDING_STATE_VALUE, secops_pipeline
 from config.settings import app_name
 from shared.utils.terminal_ui import Ansi, print_panel
 
-
-def _extract_field(obj: Any, field: str) -> Any:
-    if isinstance(obj, dict):
-        return obj.get(field)
-    return getattr(obj, field, None)
+# Stage outputs previewed in the conclusion report: (state key, label, length)
+_CONCLUSION_FIELDS = (
+    ("perception_scope", "Scope", 200),
+    ("perception_health", "Health", 200),
+    ("analysis_anomalies", "Anomalies", 200),
+    ("analysis_vulnerabilities", "Vulnerabilities", 200),
+)
+
+
+def _preview(value: Any, limit: int) -> str:
+    """Return the first ``limit`` characters of ``value`` rendered as text.
+
+    Dicts and lists are encoded incrementally as compact JSON and encoding
+    stops once enough text exists, so large state values are never rendered
+    in full just to be truncated.
+    """
+    if isinstance(value, str):
+        return value[:limit]
+    if isinstance(value, (dict, list)):
+        encoder = json.JSONEncoder(default=str, ensure_ascii=False, separators=(",", ":"))
+        parts: list[str] = []
+        size = 0
+        for chunk in encoder.iterencode(value):
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                break
+        return "".join(parts)[:limit]
+    return str(value)[:limit]
 
 
 def _format_model_name(model: Any) -> str:
     if isinstance(model, str):
         return model
-    model_name = _extract_field(model, "model")
+    model_name = getattr(model, "model", None)
     if isinstance(model_name, str):
         return model_name
     return str(model)
 
 
-def print_config_banner(prompt: str, user_id: str, session_id: str) -> None:
-    """Print the startup configuration panel."""
-    sub_agents = _extract_field(secops_pipeline, "sub_agents")
+@lru_cache(maxsize=1)
+def _static_banner_rows() -> tuple[tuple[str, Any], ...]:
+    """Banner rows describing the pipeline, which are fixed for the process."""
+    sub_agents = getattr(secops_pipeline, "sub_agents", None)
     sub_agent_count = len(sub_agents) if isinstance(sub_agents, list) else 0
-    root_tools = _extract_field(secops_pipeline, "tools")
+    root_tools = getattr(secops_pipeline, "tools", None)
     root_tool_count = len(root_tools) if isinstance(root_tools, list) else 0
-    model = _extract_field(secops_pipeline, "model")
-    rows = [
+    model = getattr(secops_pipeline, "model", None)
+    return (
         ("App", app_name()),
-        ("Active Agent", _extract_field(secops_pipeline, "name") or "unknown"),
+        ("Active Agent", getattr(secops_pipeline, "name", None) or "unknown"),
         ("Model", _format_model_name(model)),
         ("Sub-Agents", sub_agent_count),
         ("Root Tools", root_tool_count),
+    )
+
+
+def print_config_banner(prompt: str, user_id: str, session_id: str) -> None:
+    """Print the startup configuration panel."""
+    rows = [
+        *_static_banner_rows(),
         ("User/Session", f"{user_id} / {session_id}"),
         ("Prompt", prompt),
     ]
@@ -49,42 +83,28 @@ def print_config_banner(prompt: str, user_id: str, session_id: str) -> None:
 
 def print_conclusion(state: dict[str, Any], event_count: int = 0) -> None:
     """Print the conclusion report from pipeline session state."""
-    # Read directly from pipeline state keys
-    verdict = state.get("decision_verdict", "")
-    enforcement = state.get("enforcement_result", "")
-    perception_scope = state.get("perception_scope", "")
-    perception_health = state.get("perception_health", "")
-    anomalies = state.get("analysis_anomalies", "")
-    vulnerabilities = state.get("analysis_vulnerabilities", "")
-
     # Build summary rows
     rows: list[tuple[str, Any]] = [
         ("Result", "Pipeline execution finished"),
         ("Events", event_count),
     ]
 
-    # Add non-empty pipeline outputs
-    if perception_scope and perception_scope != "(not yet available)":
-        scope_preview = str(perception_scope)[:200]
-        rows.append(("Scope", scope_preview))
-    if perception_health and perception_health != "(not yet available)":
-        health_preview = str(perception_health)[:200]
-        rows.append(("Health", health_preview))
-    if anomalies and anomalies != "(not yet available)":
-        anomalies_preview = str(anomalies)[:200]
-        rows.append(("Anomalies", anomalies_preview))
-    if vulnerabilities and vulnerabilities != "(not yet available)":
-        vuln_preview = str(vulnerabilities)[:200]
-        rows.append(("Vulnerabilities", vuln_preview))
+    # Add non-empty pipeline outputs, read directly from pipeline state keys
+    for key, label, limit in _CONCLUSION_FIELDS:
+        value = state.get(key)
+        if value and value != PENDING_STATE_VALUE:
+            rows.append((label, _preview(value, limit)))
 
     # Verdict is the main output from the magistrate
+    verdict = state.get("decision_verdict", "")
     if verdict:
-        rows.append(("Verdict", str(verdict)[:400]))
+        rows.append(("Verdict", _preview(verdict, 400)))
     else:
         rows.append(("Verdict", "No verdict produced"))
 
+    enforcement = state.get("enforcement_result", "")
     if enforcement:
-        rows.append(("Enforcement", str(enforcement)[:200]))
+        rows.append(("Enforcement", _preview(enforcement, 200)))
 
     print_panel("Conclusion Report", rows, Ansi.GREEN)
 
@@ -25,12 +25,10 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from dotenv import load_dotenv
+from shared.utils.env import load_env
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
-load_dotenv(ROOT_DIR / ".env")
-
-from google.genai.types import Content, Part
+load_env()
 
 from agents.analysis.network_monitor.tools import assess_network_threats
 from agents.perception.scope_scanner.sensors import collect_scope_targets
@@ -38,9 +36,8 @@ from shared.tools.system_analyzer_tools import analyze_local_system
 from shared.utils.env import env_value
 from shared.utils.logging import setup_logging
 from shared.utils.terminal_ui import Ansi, print_panel
-from config.settings import app_name
 
-from overwatch_platform.orchestrator.runner_factory import create_runner, ensure_session
+from overwatch_platform.orchestrator.runner_factory import create_runner, ensure_session, run_prompt
 from overwatch_platform.orchestrator.scheduler import SnapshotStore, _analysis_findings
 from overwatch_platform.orchestrator.cli import print_conclusion
 
@@ -142,7 +139,7 @@ async def _run_pipeline(signals: dict[str, Any], evaluation: dict[str, Any]) ->
     runner, session_service = await create_runner()
     user_id = "overwatch"
     session_id = f"overwatch-{uuid.uuid4().hex[:8]}"
-    await ensure_session(session_service, user_id, session_id)
+    session = await ensure_session(session_service, user_id, session_id)
 
     # Build a context-rich prompt from the sweep signals
     network = signals.get("network", {})
@@ -167,18 +164,7 @@ async def _run_pipeline(signals: dict[str, Any], evaluation: dict[str, Any]) ->
 
     logger.info("pipeline: starting agent pipeline session=%s", session_id)
 
-    event_count = 0
-    async for _event in runner.run_async(
-        user_id=user_id,
-        session_id=session_id,
-        new_message=Content(role="user", parts=[Part(text=prompt)]),
-    ):
-        event_count += 1
-
-    session = await session_service.get_session(
-        app_name=app_name(), user_id=user_id, session_id=session_id,
-    )
-    state = session.state if session else {}
+    event_count, state = await run_prompt(runner, session, prompt)
 
     logger.info("pipeline: completed events=%s", event_count)
     print_conclusion(state, event_count=event_count)
@@ -211,15 +197,6 @@ async def run_overwatch(
     resolved_db = db_path or ROOT_DIR / "data" / "overwatch.db"
     store = SnapshotStore(resolved_db)
 
-    # Silence noisy loggers
-    for name in (
-        "httpx",
-        "google_adk.google.adk.models.google_llm",
-        "google_adk.google.adk.sessions.database_session_service",
-        "google_genai.types",
-    ):
-        logging.getLogger(name).setLevel(logging.ERROR)
-
     logger.info(
         "overwatch_start interval=%ss threat_threshold=%.2f finding_threshold=%s max_cycles=%s db=%s",
         interval_seconds, threat_threshold, finding_threshold, max_cycles, resolved_db,
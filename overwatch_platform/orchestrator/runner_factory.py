@@ -7,10 +7,12 @@ can be reused from tests, web endpoints, or scheduled jobs.
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 from google.adk.errors.already_exists_error import AlreadyExistsError
 from google.adk.runners import Runner
-from google.adk.sessions import DatabaseSessionService
+from google.adk.sessions import BaseSessionService, Session
+from google.genai.types import Content, Part
 
 from agents.stages import secops_pipeline
 from shared.adk.audit_plugin import SecurityAuditPlugin
@@ -21,9 +23,23 @@ from shared.utils.env import env_value
 ROOT_DIR = Path(__file__).resolve().parents[2]
 
 
-async def create_runner() -> tuple[Runner, DatabaseSessionService]:
-    """Build a fully-wired ADK Runner with session and memory services."""
+def _build_session_service() -> BaseSessionService:
+    """In-memory sessions unless persistence is configured.
+
+    Sessions are stored in a database when ``ADK_SESSION_DB_URL`` is set, or
+    in SQLite at ``ADK_SESSION_DB_PATH`` when ``ADK_PERSIST_SESSION`` is true.
+    A one-shot run otherwise skips a database write for every event.
+    """
     db_url = env_value("ADK_SESSION_DB_URL")
+    persist = (env_value("ADK_PERSIST_SESSION", "false") or "false").lower() in ("1", "true", "yes")
+    if not db_url and not persist:
+        from google.adk.sessions import InMemorySessionService
+
+        return InMemorySessionService()
+
+    # SQLAlchemy and the async SQLite driver load only when sessions persist.
+    from google.adk.sessions.database_session_service import DatabaseSessionService
+
     if not db_url:
         db_path = Path(
             env_value("ADK_SESSION_DB_PATH", "./data/adk_sessions.db")
@@ -33,8 +49,12 @@ async def create_runner() -> tuple[Runner, DatabaseSessionService]:
             db_path = ROOT_DIR / db_path
         db_path.parent.mkdir(parents=True, exist_ok=True)
         db_url = f"sqlite+aiosqlite:///{db_path.resolve()}"
+    return DatabaseSessionService(db_url=db_url)
+
 
-    session_service = DatabaseSessionService(db_url=db_url)
+async def create_runner() -> tuple[Runner, BaseSessionService]:
+    """Build a fully-wired ADK Runner with session and memory services."""
+    session_service = _build_session_service()
     memory_service = build_memory_service()
 
     runner = Runner(
@@ -48,19 +68,52 @@ async def create_runner() -> tuple[Runner, DatabaseSessionService]:
 
 
 async def ensure_session(
-    session_service: DatabaseSessionService,
+    session_service: BaseSessionService,
     user_id: str,
     session_id: str,
-) -> None:
-    """Create a session, ignoring if it already exists (idempotent reruns)."""
+) -> Session:
+    """Create a session, or load it if it already exists (idempotent reruns).
+
+    Raises ``RuntimeError`` if the session exists but cannot be loaded back,
+    e.g. when it was deleted between the create and the read.
+    """
     try:
-        await session_service.create_session(
+        return await session_service.create_session(
             app_name=app_name(),
             user_id=user_id,
             session_id=session_id,
         )
     except AlreadyExistsError:
-        pass
+        session = await session_service.get_session(
+            app_name=app_name(),
+            user_id=user_id,
+            session_id=session_id,
+        )
+    if session is None:
+        raise RuntimeError(
+            f"Session {session_id!r} for user {user_id!r} already exists but could not be loaded"
+        )
+    return session
+
+
+async def run_prompt(runner: Runner, session: Session, prompt: str) -> tuple[int, dict[str, Any]]:
+    """Run ``prompt`` through the pipeline and return (event count, final state).
+
+    The final state is the session's starting state with each event's state
+    delta applied in order, which is what the session service persists, so
+    the session does not have to be read back after the run.
+    """
+    state = dict(session.state)
+    event_count = 0
+    async for event in runner.run_async(
+        user_id=session.user_id,
+        session_id=session.id,
+        new_message=Content(role="user", parts=[Part(text=prompt)]),
+    ):
+        event_count += 1
+        if event.actions.state_delta:
+            state.update(event.actions.state_delta)
+    return event_count, state
 
 
 def get_user_config() -> tuple[str, str, str]:
@@ -11,6 +11,7 @@ from typing import Any
 from agents.analysis.vulnerability_assessor.tools import run_scope_security_sweep
 from agents.perception.scope_scanner.sensors import collect_scope_targets
 from shared.tools.system_analyzer_tools import analyze_local_system
+from shared.utils import serialization
 from shared.utils.env import env_value
 from shared.utils.logging import setup_logging
 
@@ -119,7 +120,7 @@ class SnapshotStore:
         captured_at: str | None = None,
     ) -> int:
         at = captured_at or datetime.now(UTC).isoformat()
-        encoded = json.dumps(payload, default=str)
+        encoded = serialization.dumps(payload)
         with self._connect() as connection:
             cursor = connection.execute(
                 """
@@ -145,7 +146,7 @@ class SnapshotStore:
             ).fetchone()
         if row is None:
             return None
-        payload = json.loads(row["payload_json"])
+        payload = serialization.loads(row["payload_json"])
         return {
             "id": int(row["id"]),
             "captured_at": str(row["captured_at"]),
@@ -167,7 +168,7 @@ class SnapshotStore:
             ).fetchall()
         results: list[dict[str, Any]] = []
         for row in rows:
-            payload = json.loads(row["payload_json"])
+            payload = serialization.loads(row["payload_json"])
             results.append(
                 {
                     "id": int(row["id"]),
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Register module ``name`` now but defer executing it to first attribute access.
+
+    Uses ``importlib.util.LazyLoader``: the module object lands in
+    ``sys.modules`` (so later ``import`` statements share it), while its body,
+    and every import it triggers, only runs once an attribute is read. Resolve
+    attributes inside functions rather than at module level, so that import
+    cycles cannot force a half-initialized module. Parent packages are
+    imported eagerly and should themselves stay cheap to import.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    # Finding the spec imports the parent package, which may load the module.
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
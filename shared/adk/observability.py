@@ -12,10 +12,14 @@ import json
 import threading
 import time
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Any
 
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
 from shared.utils.env import env_value
-from shared.security.policy_loader import get_blocked_commands, get_prompt_injection_patterns
+from shared.security.policy_loader import find_blocked_command, get_prompt_injection_patterns
 from shared.utils.terminal_ui import (
     Ansi,
     color as _color,
@@ -96,6 +100,10 @@ def _to_mapping(value: Any) -> dict[str, Any] | None:
     return None
 
 
+# Text and function call of a genai ``Part``, read without serializing it.
+_part_fields = attrgetter("text", "function_call")
+
+
 def _extract_field(obj: Any, field: str) -> Any:
     if isinstance(obj, dict):
         return obj.get(field)
@@ -169,11 +177,12 @@ def _format_args_inline(args: dict[str, Any] | None) -> str:
 
 def _extract_token_metrics(llm_response: Any) -> dict[str, int]:
     """Extract token usage from an LLM response."""
-    data = _to_mapping(llm_response)
-    if not data:
+    usage = _extract_field(llm_response, "usage_metadata")
+    if usage is None:
         return {}
-    usage = data.get("usage_metadata") or {}
-    if not isinstance(usage, dict):
+    # Serialize only the usage block, never the whole response.
+    usage = _to_mapping(usage)
+    if usage is None:
         return {}
     return {
         "prompt": usage.get("prompt_token_count", 0) or 0,
@@ -184,45 +193,32 @@ def _extract_token_metrics(llm_response: Any) -> dict[str, int]:
 
 
 def _extract_model_version(llm_response: Any) -> str:
-    data = _to_mapping(llm_response)
-    if data:
-        version = data.get("model_version")
-        if isinstance(version, str):
-            return version
-    return ""
+    version = _extract_field(llm_response, "model_version")
+    return version if isinstance(version, str) else ""
 
 
 def _extract_response_text(llm_response: Any) -> str:
     """Extract the text summary from an LLM response for display."""
-    data = _to_mapping(llm_response)
-    if not data:
-        return "(non-text response)"
-
-    content = data.get("content")
-    if not isinstance(content, dict):
-        return "(non-text response)"
-
-    parts = content.get("parts", [])
+    content = _extract_field(llm_response, "content")
+    parts = _extract_field(content, "parts")
     if not isinstance(parts, list):
         return "(non-text response)"
 
     text_chunks = []
+    fc_names = []
     for part in parts:
-        if not isinstance(part, dict):
-            continue
-        text = part.get("text")
+        if isinstance(part, dict):
+            text, function_call = part.get("text"), part.get("function_call")
+        else:
+            text, function_call = _part_fields(part)
         if isinstance(text, str) and text.strip():
             text_chunks.append(text.strip())
+        if function_call is not None:
+            name = _extract_field(function_call, "name")
+            fc_names.append("?" if name is None else name)
 
     if not text_chunks:
         # Check for function calls
-        fc_names = []
-        for part in parts:
-            if isinstance(part, dict):
-                fc = part.get("function_call")
-                if isinstance(fc, dict):
-                    name = fc.get("name", "?")
-                    fc_names.append(name)
         if fc_names:
             return f"→ Calling: {', '.join(fc_names)}"
         return "(non-text response)"
@@ -234,16 +230,12 @@ def _extract_response_text(llm_response: Any) -> str:
 
 
 def _check_blocked_commands(args: dict[str, Any] | None) -> str | None:
-    """Return a reason string if any arg value contains a blocked pattern."""
+    """Return a reason string if any arg value, at any depth, contains a blocked pattern."""
     if not args:
         return None
-    blocked = get_blocked_commands()
-    for _key, val in args.items():
-        if not isinstance(val, str):
-            continue
-        for pattern in blocked:
-            if pattern in val:
-                return f"Blocked by guardrail policy: command contains '{pattern}'"
+    match = find_blocked_command(args)
+    if match:
+        return f"Blocked by guardrail policy: command contains '{match}'"
     return None
 
 
@@ -372,20 +364,17 @@ def before_model_callback(callback_context: Any, llm_request: Any) -> Any:
     if not injection_patterns:
         return None
 
-    text_to_scan = ""
-    data = _to_mapping(llm_request)
-    if data and isinstance(data, dict):
-        contents = data.get("contents", [])
-        if isinstance(contents, list):
-            for content in contents:
-                if isinstance(content, dict):
-                    parts = content.get("parts", [])
-                    if isinstance(parts, list):
-                        for part in parts:
-                            if isinstance(part, dict):
-                                text = part.get("text", "")
-                                if isinstance(text, str):
-                                    text_to_scan += text.lower() + " "
+    texts: list[str] = []
+    contents = _extract_field(llm_request, "contents")
+    if isinstance(contents, list):
+        for content in contents:
+            parts = _extract_field(content, "parts")
+            if isinstance(parts, list):
+                for part in parts:
+                    text = _extract_field(part, "text")
+                    if isinstance(text, str):
+                        texts.append(text.lower() + " ")
+    text_to_scan = "".join(texts)
 
     for pattern in injection_patterns:
         if pattern.lower() in text_to_scan:
@@ -439,3 +428,30 @@ def after_model_callback(callback_context: Any, llm_response: Any) -> Any:
         color_code=Ansi.MAGENTA,
     )
     return None
+
+
+def on_model_error_callback(callback_context: Any, llm_request: Any, error: Exception) -> LlmResponse:
+    """Answer a failed model call with a placeholder instead of raising.
+
+    Stage siblings run in one asyncio task group, so an exception from one
+    agent would cancel the others and abort the pipeline. The failure is
+    recorded in ``state["warnings"]`` and the agent's output becomes a short
+    notice, letting siblings finish and later stages run on what remains.
+    """
+    agent = _agent_name_from_callback_context(callback_context)
+    message = f"{agent} model call failed: {type(error).__name__}: {error}"
+
+    state = getattr(callback_context, "state", None)
+    if state is not None:
+        warnings = state.get("warnings")
+        state["warnings"] = [*(warnings if isinstance(warnings, list) else []), message]
+
+    if _aop_enabled():
+        print_rich_panel(
+            f"⚠ Agent: {agent} [Model Error]",
+            header_line=f"[{_next_step():03d}] {message}",
+            color_code=Ansi.RED,
+        )
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=f"({agent} unavailable: {error})")])
+    )
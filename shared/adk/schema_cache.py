@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+
+class CachedFunctionTool(FunctionTool):
+    """FunctionTool that reflects its function into a declaration only once.
+
+    Some ADK releases rebuild the declaration (signature + type hints + pydantic
+    schema) on every LLM request, and re-wrap bare callables in a fresh
+    FunctionTool each time. Registering tools as instances of this class keeps
+    one declaration per API variant for the life of the process. A deep copy
+    is returned because request builders may mutate the declaration.
+    """
+
+    def __init__(self, func: Callable[..., Any], *, require_confirmation: Any = False):
+        super().__init__(func=func, require_confirmation=require_confirmation)
+        self._declarations: dict[Any, Optional[types.FunctionDeclaration]] = {}
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        variant = self._api_variant
+        if variant not in self._declarations:
+            self._declarations[variant] = super()._get_declaration()
+        declaration = self._declarations[variant]
+        return declaration.model_copy(deep=True) if declaration is not None else None
+
+
+@lru_cache(maxsize=None)
+def cached_tool(func: Callable[..., Any], require_confirmation: bool = False) -> CachedFunctionTool:
+    """Return the process-wide schema-cached tool for ``func``."""
+    return CachedFunctionTool(func=func, require_confirmation=require_confirmation)
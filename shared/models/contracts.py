@@ -54,3 +54,8 @@ class RootAgentResponse(BaseModel):
     supporting_delegations: List[DelegationDecision] = Field(default_factory=list)
     final_summary: str
     recommended_next_steps: List[str] = Field(default_factory=list)
+
+
+# Field lists quoted in agent prompts, computed once per process.
+SYSTEM_HEALTH_REPORT_FIELDS = ", ".join(SystemHealthReport.model_fields)
+ROOT_AGENT_RESPONSE_FIELDS = ", ".join(RootAgentResponse.model_fields)
@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     sender: str
     recipient: str
@@ -7,6 +7,7 @@ policies used by callbacks and plugins across the agent pipeline.
 from __future__ import annotations
 
 import os
+import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
@@ -53,6 +54,34 @@ def get_blocked_commands() -> list[str]:
     return get_guardrails().get("blocked_commands", [])
 
 
+@lru_cache(maxsize=1)
+def get_blocked_commands_pattern() -> re.Pattern[str] | None:
+    """Return one compiled matcher for all blocked command substrings (cached)."""
+    blocked = get_blocked_commands()
+    if not blocked:
+        return None
+    return re.compile("|".join(map(re.escape, blocked)))
+
+
+def find_blocked_command(value: Any) -> str | None:
+    """Return the first blocked command found in ``value``, searching nested dicts and lists."""
+    blocked = get_blocked_commands_pattern()
+    if blocked is None:
+        return None
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            match = blocked.search(item)
+            if match:
+                return match.group()
+        elif isinstance(item, dict):
+            stack.extend(reversed(item.values()))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+    return None
+
+
 def get_confirmation_tools() -> list[str]:
     """Return tool names that require human confirmation."""
     return get_guardrails().get("require_confirmation", [])
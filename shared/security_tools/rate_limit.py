@@ -0,0 +1,102 @@
+"""
+Token-bucket admission control for execution and remediation tools.
+
+A runaway model can call a high-risk executor in a tight loop. Each tool
+wrapped with ``rate_limited`` owns a token bucket; when the bucket is empty
+the call is denied up front (no subprocess, no side effects) with a
+429-style payload so the agent can back off deterministically.
+
+Tiers (burst capacity / refill per second):
+- high:   10 / 2   — command executors, process termination, isolation
+- medium: 20 / 5   — network blocking, credential disabling, rollback
+- low:    50 / 10  — verification and credential rotation
+"""
+
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict
+
+
+TIERS: Dict[str, tuple[int, float]] = {
+    "high": (10, 2.0),
+    "medium": (20, 5.0),
+    "low": (50, 10.0),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled lazily on each acquire."""
+
+    __slots__ = ("tokens", "cap", "rate", "last", "_lock")
+
+    def __init__(self, cap: int, rate: float) -> None:
+        self.tokens = float(cap)
+        self.cap = float(cap)
+        self.rate = rate
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """
+        Take one token.
+
+        Returns:
+            0.0 when a token was taken, otherwise the seconds until one is free.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.cap, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return 0.0
+            return (1.0 - self.tokens) / self.rate
+
+
+def _denied(wait_seconds: float) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": "rate_limited",
+        "retry_after_ms": int(wait_seconds * 1000) + 1,
+    }
+
+
+def is_rate_limited(result: Any) -> bool:
+    """Whether ``result`` is the denial payload returned by a ``rate_limited`` tool."""
+    return isinstance(result, dict) and result.get("error") == "rate_limited"
+
+
+def rate_limited(tier: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a tool so calls beyond its tier's budget are denied.
+
+    The wrapper keeps the tool's name, docstring and signature (ADK builds the
+    function schema from them) and stays a coroutine function when the tool is
+    one. The bucket is exposed as ``wrapper.bucket`` for tests and tuning.
+    """
+    cap, rate = TIERS[tier]
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        bucket = TokenBucket(cap, rate)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                wait = bucket.try_acquire()
+                if wait:
+                    return _denied(wait)
+                return await fn(*args, **kwargs)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                wait = bucket.try_acquire()
+                if wait:
+                    return _denied(wait)
+                return fn(*args, **kwargs)
+
+        wrapper.bucket = bucket
+        return wrapper
+
+    return decorate
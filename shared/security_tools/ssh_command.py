@@ -5,10 +5,157 @@ Execute commands on remote hosts via SSH using password authentication.
 Adapted from CAI's sshpass.py.
 
 Requires: sshpass installed on the system
+
+Connections are pooled with OpenSSH connection multiplexing: the first call
+to a (user, host, port) starts a background ControlMaster that later calls
+reuse, so only the first command pays the TCP + auth handshake. The master is
+tied to the credential it logged in with; a different password tears it down
+and authenticates afresh. A failed connection invalidates its entry so the
+next call reconnects.
 """
 
-import shlex
-from .common import run_command
+import hashlib
+import hmac
+import os
+import stat
+import subprocess
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from .common import get_workspace_dir
+
+
+_CONTROL_DIR = os.path.join(tempfile.gettempdir(), f"overwatch-ssh-{os.getuid()}")
+_CONTROL_PERSIST_SECONDS = 300
+_SSH_CONNECTION_ERROR = 255
+_SSH_TIMEOUT_SECONDS = 60
+
+# Per-process key for credential fingerprints, so no reusable password hash is
+# kept in memory or leaks into socket names.
+_FINGERPRINT_KEY = os.urandom(16)
+
+# (username, host, port) -> (credential fingerprint, ControlPath of its master)
+_SESSIONS: Dict[Tuple[str, str, int], Tuple[str, str]] = {}
+
+_SSH_OPTIONS = (
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "UserKnownHostsFile=/dev/null",
+    "-o", "LogLevel=ERROR",
+)
+
+
+def _session_key(username: str, host: str, port: int | str) -> Tuple[str, str, int]:
+    """The one place ports are normalized, so "22" and 22 share an entry."""
+    return (username, host, int(port))
+
+
+def _fingerprint(password: str) -> str:
+    return hmac.new(_FINGERPRINT_KEY, password.encode(), hashlib.sha256).hexdigest()
+
+
+def _control_dir() -> Optional[str]:
+    """Return a private socket directory, or None if it can't be trusted."""
+    try:
+        os.makedirs(_CONTROL_DIR, mode=0o700, exist_ok=True)
+        st = os.lstat(_CONTROL_DIR)
+    except OSError:
+        return None
+    # Someone else's directory could hold a socket that hijacks our sessions.
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        return None
+    return _CONTROL_DIR
+
+
+def _control_path(key: Tuple[str, str, int], fingerprint: str) -> Optional[str]:
+    """Return the socket for ``key`` logged in with ``fingerprint``.
+
+    A master started with another credential is closed first; the socket name
+    also covers the credential, so a master that fails to exit is never reused.
+    """
+    entry = _SESSIONS.get(key)
+    if entry is not None:
+        if entry[0] == fingerprint:
+            return entry[1]
+        invalidate_cache_entry(*key)
+    directory = _control_dir()
+    if directory is None:
+        return None
+    digest = hashlib.sha256("\0".join((*map(str, key), fingerprint)).encode()).hexdigest()[:20]
+    path = os.path.join(directory, digest)
+    _SESSIONS[key] = (fingerprint, path)
+    return path
+
+
+def _target(username: str, host: str, port: int) -> List[str]:
+    # "--" keeps a username such as "-oProxyCommand=..." from parsing as an option.
+    return ["-p", str(port), "--", f"{username}@{host}"]
+
+
+def _master_alive(control_path: str, username: str, host: str, port: int) -> bool:
+    try:
+        check = subprocess.run(
+            ["ssh", "-o", f"ControlPath={control_path}", "-O", "check", *_target(username, host, port)],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return check.returncode == 0
+
+
+def _start_master(
+    control_path: str, username: str, host: str, port: int, password: str
+) -> Tuple[int, str]:
+    """Log in and leave a background master on ``control_path``.
+
+    ``-f -N`` forks the master once authenticated. It keeps its stderr open
+    for its whole life, so stderr goes to a file rather than a pipe; reading a
+    pipe would block until the master exits ``ControlPersist`` seconds later.
+    """
+    argv = [
+        "sshpass", "-p", password,
+        "ssh", *_SSH_OPTIONS,
+        "-f", "-N",
+        "-o", "ControlMaster=yes",
+        "-o", f"ControlPath={control_path}",
+        "-o", f"ControlPersist={_CONTROL_PERSIST_SECONDS}",
+        *_target(username, host, port),
+    ]
+    with tempfile.TemporaryFile() as stderr:
+        result = subprocess.run(
+            argv,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr,
+            timeout=_SSH_TIMEOUT_SECONDS,
+            cwd=get_workspace_dir(),
+        )
+        stderr.seek(0)
+        return result.returncode, stderr.read().decode(errors="replace")
+
+
+def invalidate_cache_entry(username: str, host: str, port: int | str = 22) -> None:
+    """Close and forget the pooled connection for one (user, host, port)."""
+    key = _session_key(username, host, port)
+    entry = _SESSIONS.pop(key, None)
+    if entry is None:
+        return
+    try:
+        subprocess.run(
+            ["ssh", "-o", f"ControlPath={entry[1]}", "-O", "exit", *_target(*key)],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        pass  # no master running, or ssh itself unavailable
+
+
+def reset_cache() -> None:
+    """Close every pooled SSH connection."""
+    for username, host, port in list(_SESSIONS):
+        invalidate_cache_entry(username, host, port)
 
 
 def run_ssh_command_with_credentials(
@@ -46,20 +193,55 @@ def run_ssh_command_with_credentials(
     except (ValueError, TypeError):
         return "Error: Port is not a valid integer"
     
-    # Escape special characters to prevent shell injection
-    quoted_password = shlex.quote(password)
-    quoted_username = shlex.quote(username)
-    quoted_host = shlex.quote(host)
-    quoted_command = shlex.quote(command)
-    
-    # Build SSH command with sshpass
-    ssh_command = (
-        f"sshpass -p {quoted_password} "
-        f"ssh -o StrictHostKeyChecking=no "
-        f"-o UserKnownHostsFile=/dev/null "
-        f"-o LogLevel=ERROR "
-        f"{quoted_username}@{quoted_host} -p {port} "
-        f"{quoted_command}"
-    )
-    
-    return run_command(ssh_command, timeout=60)
+    key = _session_key(username, host, port)
+    control_path = _control_path(key, _fingerprint(password))
+    multiplex_options: List[str] = []
+    if control_path:
+        try:
+            if not _master_alive(control_path, username, host, port):
+                returncode, stderr = _start_master(control_path, username, host, port, password)
+                if returncode != 0:
+                    invalidate_cache_entry(username, host, port)
+                    return f"Error: SSH connection failed (exit {returncode})\nSTDERR:\n{stderr.strip()}"
+        except subprocess.TimeoutExpired:
+            invalidate_cache_entry(username, host, port)
+            return f"Error: Command timed out after {_SSH_TIMEOUT_SECONDS} seconds"
+        except Exception as e:
+            invalidate_cache_entry(username, host, port)
+            return f"Error executing command: {str(e)}"
+        multiplex_options = ["-o", "ControlMaster=no", "-o", f"ControlPath={control_path}"]
+
+    # argv form: nothing is interpreted by a local shell. sshpass still answers
+    # the prompt if the master has gone away and ssh falls back to a direct login.
+    ssh_command = [
+        "sshpass", "-p", password,
+        "ssh", *_SSH_OPTIONS, *multiplex_options,
+        *_target(username, host, port),
+        command,
+    ]
+
+    try:
+        result = subprocess.run(
+            ssh_command,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=_SSH_TIMEOUT_SECONDS,
+            cwd=get_workspace_dir(),
+        )
+    except subprocess.TimeoutExpired:
+        invalidate_cache_entry(username, host, port)
+        return f"Error: Command timed out after {_SSH_TIMEOUT_SECONDS} seconds"
+    except Exception as e:
+        invalidate_cache_entry(username, host, port)
+        return f"Error executing command: {str(e)}"
+
+    # 255 is ssh's own connection/auth failure: drop the (possibly stale)
+    # master so the next call performs a fresh handshake.
+    if result.returncode == _SSH_CONNECTION_ERROR:
+        invalidate_cache_entry(username, host, port)
+
+    output = result.stdout
+    if result.stderr:
+        output += f"\nSTDERR:\n{result.stderr}"
+    return output.strip() if output else "(no output)"
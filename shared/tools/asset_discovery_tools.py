@@ -7,6 +7,8 @@ import shutil
 import subprocess
 from typing import Any, Dict, List
 
+from shared.utils.cache import ttl_cache
+
 
 def _run_command(command: List[str], timeout_seconds: int = 3) -> subprocess.CompletedProcess[str] | None:
     try:
@@ -229,6 +231,8 @@ def _map_processes_to_services(
     return mappings
 
 
+# Short TTL: one analysis pass chains several readers over the same snapshot.
+@ttl_cache(ttl=2)
 def discover_runtime_assets(max_processes: int = 200) -> Dict[str, Any]:
     processes = _discover_processes(limit=max(10, min(max_processes, 2000)))
     containers = _discover_docker_containers()
@@ -5,10 +5,11 @@ from datetime import UTC, datetime
 from typing import Any, Dict, List
 
 import requests
+from shared.utils.cache import ttl_cache
 from shared.utils.env import env_value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricDef:
     name: str
     unit: str
@@ -214,6 +215,7 @@ def _mock_series_bundle(selected_metric_names: set[str]) -> List[Dict[str, Any]]
     return [series for name, series in mock_map.items() if name in selected_metric_names]
 
 
+@ttl_cache(ttl=2)
 def fetch_metrics(query: str) -> Dict[str, Any]:
     selected_metric_names = _metric_name_filter(query)
     live_result = _build_live_series(selected_metric_names)
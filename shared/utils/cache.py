@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable
+
+
+def _cache_key(signature: inspect.Signature, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Key on the bound arguments, so positional, keyword and defaulted calls agree."""
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return None  # invalid call: let the function raise, uncached
+    bound.apply_defaults()
+    if not bound.kwargs:
+        return bound.args
+    return (bound.args, tuple(sorted(bound.kwargs.items())))
+
+
+def ttl_cache(
+    ttl: float,
+    maxsize: int = 1024,
+    *,
+    skip: Callable[[Any], bool] | None = None,
+    copy_result: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize results for ``ttl`` seconds, keyed on the call arguments.
+
+    Works for plain and coroutine functions (the awaited result is cached).
+    Arguments are bound to the signature with defaults applied, so ``f(x)``,
+    ``f(arg=x)`` and ``f()`` with ``x`` as the default share one entry.
+    Cached values are shared between callers and must be treated as read-only;
+    pass ``copy_result=True`` when callers need a private deep copy (stored
+    and handed out per hit, at the cost of copying every time). Results for
+    which ``skip`` returns true (e.g. a rate-limit denial) are returned but
+    not stored. Calls with unhashable arguments bypass the cache. The table
+    is guarded by a lock, so threads may share a decorated function;
+    concurrent misses each call through and the last result is kept. The
+    decorated function gains ``cache_clear()`` so callers can invalidate
+    after a state change.
+    """
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        entries: dict[Any, tuple[float, Any]] = {}
+        lock = threading.Lock()
+        signature = inspect.signature(fn)
+
+        def lookup(key: Any) -> tuple[bool, Any]:
+            with lock:
+                try:
+                    expires, value = entries[key]
+                except (KeyError, TypeError):
+                    return False, None
+                if expires <= time.monotonic():
+                    entries.pop(key, None)
+                    return False, None
+            return True, copy.deepcopy(value) if copy_result else value
+
+        def store(key: Any, value: Any) -> None:
+            if key is None or (skip is not None and skip(value)):
+                return
+            try:
+                hash(key)
+            except TypeError:
+                return
+            if copy_result:
+                value = copy.deepcopy(value)
+            with lock:
+                if key not in entries and len(entries) >= maxsize:
+                    entries.pop(next(iter(entries)), None)
+                entries[key] = (time.monotonic() + ttl, value)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = _cache_key(signature, args, kwargs)
+                hit, value = lookup(key)
+                if hit:
+                    return value
+                value = await fn(*args, **kwargs)
+                store(key, value)
+                return value
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = _cache_key(signature, args, kwargs)
+                hit, value = lookup(key)
+                if hit:
+                    return value
+                value = fn(*args, **kwargs)
+                store(key, value)
+                return value
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorate
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
 
 
 UNSET_SENTINELS = {
@@ -24,3 +30,12 @@ def env_value(name: str, default: str | None = None) -> str | None:
     if value.lower() in UNSET_SENTINELS:
         return default
     return value
+
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load the repository ``.env`` into the environment, once per process.
+
+    Variables already set in the environment take precedence.
+    """
+    load_dotenv(ROOT_DIR / ".env")
@@ -6,6 +6,14 @@ from shared.utils.env import env_value
 _ROOT_DIR = Path(__file__).resolve().parents[2]
 _DEFAULT_LOG_DIR = _ROOT_DIR / "data" / "logs"
 
+# Third-party loggers that are too chatty below ERROR
+_NOISY_LOGGERS = (
+    "httpx",
+    "google_adk.google.adk.models.google_llm",
+    "google_adk.google.adk.sessions.database_session_service",
+    "google_genai.types",
+)
+
 
 def setup_logging(level: int = logging.INFO) -> None:
     """Configure logging to stdout + optional rotating file."""
@@ -13,6 +21,8 @@ def setup_logging(level: int = logging.INFO) -> None:
 
     root = logging.getLogger()
     root.setLevel(level)
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.ERROR)
 
     # Avoid adding duplicate handlers on repeated calls
     if root.handlers:
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import math
+from enum import Enum
+from typing import Any
+
+try:  # Optional: Rust-backed encoder for large inventory/scan payloads.
+    import orjson
+except ImportError:  # orjson is not a hard dependency
+    orjson = None
+
+
+if orjson is not None:
+    # Datetimes and dataclasses go through ``default=str`` as with json.dumps.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _needs_stdlib(payload: Any) -> bool:
+    """Whether ``payload`` holds values orjson would encode differently.
+
+    orjson writes NaN/Infinity as ``null`` and enums as their value, where
+    json.dumps writes ``NaN`` and ``str(member)``.
+    """
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, Enum):
+            return True
+    return False
+
+
+def dumps(payload: Any) -> str:
+    """Encode ``payload`` as compact JSON, stringifying unsupported values.
+
+    Decodes to the same value as ``json.dumps(payload, default=str)``; only
+    whitespace and the escaping of non-ASCII text differ. orjson is used when
+    installed, except for payloads holding non-finite floats or enums and
+    payloads it rejects (e.g. integers beyond 64 bits), which go to the
+    standard library encoder.
+    """
+    if orjson is not None and not _needs_stdlib(payload):
+        try:
+            return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(payload, default=str, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document, using orjson when installed.
+
+    Documents orjson rejects but the standard library accepts (``NaN``,
+    integers beyond 64 bits) are retried with ``json.loads``, so the result
+    and the ``ValueError`` raised for invalid input match the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -10,6 +10,7 @@ from __future__ import annotations
 import shutil
 import sys
 import textwrap
+from functools import lru_cache
 from typing import Any
 
 from shared.utils.env import env_value
@@ -32,7 +33,9 @@ class Ansi:
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def color_enabled() -> bool:
+    """Whether to emit ANSI colors; fixed for the process (``cache_clear`` to re-read)."""
     force = (env_value("ADK_FORCE_COLOR", "true") or "true").lower()
     if force in {"0", "false", "no"}:
         return False
@@ -65,7 +68,17 @@ def wrap_row(label: str, value: Any, width: int) -> list[str]:
     """Format ``label: value`` with continuation-indent wrapping."""
     prefix = f"{label}: "
     available = max(12, width - len(prefix))
-    chunks = wrap_text(str(value), available)
+    text = str(value)
+    # Single-line values without tabs or trailing blanks come out of textwrap
+    # unchanged: as-is when they fit, or cut every `available` columns when
+    # there is no space or hyphen to break on.
+    plain = text.isprintable() and not text.endswith(" ")
+    if plain and len(text) <= available:
+        return [f"{prefix}{text}"]
+    if plain and " " not in text and "-" not in text:
+        chunks = [text[i:i + available] for i in range(0, len(text), available)]
+    else:
+        chunks = wrap_text(text, available)
     lines = [f"{prefix}{chunks[0]}"]
     indent = " " * len(prefix)
     for extra in chunks[1:]:
@@ -92,31 +105,33 @@ def _render_box(
     max_w = (width or terminal_width()) - 2 - indent
     title_text = f" {title} "
 
-    content_w = max(
-        len(title_text),
-        max((len(l) for l in body_lines), default=0),
-        36,
-    )
-    content_w = min(content_w, max_w)
-
-    # Normalize lines that exceed content_w
-    normalized: list[str] = []
-    for line in body_lines:
-        if len(line) <= content_w:
-            normalized.append(line)
-        else:
-            normalized.extend(textwrap.wrap(line, width=content_w))
-
-    pad = " " * indent
+    longest = max((len(l) for l in body_lines), default=0)
+    content_w = min(max(len(title_text), longest, 36), max_w)
+
+    # Callers pre-wrap their rows, so re-wrap only when the box is narrower
+    # than the widest line.
+    normalized = body_lines
+    if longest > content_w:
+        normalized = []
+        for line in body_lines:
+            if len(line) <= content_w:
+                normalized.append(line)
+            else:
+                normalized.extend(textwrap.wrap(line, width=content_w))
+
+    start, end = (color_code, Ansi.RESET) if color_enabled() else ("", "")
+    pad = f"{start}{' ' * indent}"
     right_fill = content_w - len(title_text)
-    top = f"{pad}╭─{title_text}{'─' * right_fill}╮"
-    bot = f"{pad}╰{'─' * (content_w + 1)}╯"
 
-    out = [top]
-    for line in normalized:
-        out.append(f"{pad}│ {line.ljust(content_w)}│")
-    out.append(bot)
-    return [color(l, color_code) for l in out]
+    out = [f"{pad}╭─{title_text}{'─' * right_fill}╮{end}"]
+    out.extend([f"{pad}│ {line.ljust(content_w)}│{end}" for line in normalized])
+    out.append(f"{pad}╰{'─' * (content_w + 1)}╯{end}")
+    return out
+
+
+def _emit(lines: list[str]) -> None:
+    """Write a blank separator line and the panel in a single write."""
+    sys.stdout.write("\n" + "\n".join(lines) + "\n")
 
 
 def print_panel(title: str, rows: list[tuple[str, Any]], color_code: str) -> None:
@@ -126,8 +141,7 @@ def print_panel(title: str, rows: list[tuple[str, Any]], color_code: str) -> Non
     for label, value in rows:
         body.extend(wrap_row(label, value, w - 6))
     lines = _render_box(title, body, color_code, w)
-    print("")
-    print("\n".join(lines))
+    _emit(lines)
 
 
 # ── Rich panel (new UI) ─────────────────────────────────────────────
@@ -143,8 +157,7 @@ def print_compact_panel(title: str, body: str, color_code: str) -> None:
     w = terminal_width()
     body_lines = wrap_text(body, w - 6)
     lines = _render_box(title, body_lines, color_code, w)
-    print("")
-    print("\n".join(lines))
+    _emit(lines)
 
 
 def print_rich_panel(
@@ -201,5 +214,4 @@ def print_rich_panel(
         body.extend(wrap_text(footer_line, inner_w))
 
     lines = _render_box(title, body, color_code, w)
-    print("")
-    print("\n".join(lines))
+    _emit(lines)
@@ -0,0 +1,33 @@
+"""
+Test deferred module loading used to keep agent imports cheap.
+"""
+import sys
+
+from shared.adk.lazy import lazy_module
+
+
+class TestLazyModule:
+    """lazy_module registers a module without running it until first use."""
+
+    def test_module_body_runs_on_first_attribute_access(self, tmp_path, monkeypatch):
+        package = tmp_path / "lazy_pkg_demo"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "heavy.py").write_text("import builtins\nbuiltins._lazy_demo_runs += 1\nvalue = 42\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr("builtins._lazy_demo_runs", 0, raising=False)
+
+        try:
+            module = lazy_module("lazy_pkg_demo.heavy")
+            import builtins
+
+            assert builtins._lazy_demo_runs == 0
+            assert lazy_module("lazy_pkg_demo.heavy") is module
+            assert module.value == 42
+            assert builtins._lazy_demo_runs == 1
+
+            from lazy_pkg_demo import heavy
+            assert heavy is module
+        finally:
+            sys.modules.pop("lazy_pkg_demo.heavy", None)
+            sys.modules.pop("lazy_pkg_demo", None)
@@ -78,3 +78,81 @@ class TestPipelineStructure:
         mag = root.sub_agents[2]
         enforcer = next(a for a in mag.sub_agents if a.name == "security_enforcer")
         assert enforcer.output_key == "enforcement_result"
+
+    def test_state_defaults_are_seeded_once(self):
+        from types import SimpleNamespace
+        from agents import stages
+
+        state = {"perception_scope": "scanned"}
+        stages._seed_state(SimpleNamespace(state=state))
+        assert state["perception_scope"] == "scanned"
+        assert state["decision_verdict"] == ""
+
+        state["decision_verdict"] = None
+        stages._seed_state(SimpleNamespace(state=state))
+        assert state["decision_verdict"] is None
+
+
+    def test_stage_agents_survive_model_errors(self):
+        from types import SimpleNamespace
+        from shared.adk.observability import on_model_error_callback
+
+        root = _load_pipeline()
+        for stage in root.sub_agents[:2]:
+            for agent in stage.sub_agents:
+                assert agent.on_model_error_callback is on_model_error_callback, agent.name
+
+        context = SimpleNamespace(agent_name="network_monitor", state={"warnings": ["earlier"]})
+        response = on_model_error_callback(context, None, TimeoutError("upstream timed out"))
+
+        assert response.content.parts[0].text == "(network_monitor unavailable: upstream timed out)"
+        assert context.state["warnings"] == [
+            "earlier",
+            "network_monitor model call failed: TimeoutError: upstream timed out",
+        ]
+
+
+class TestAnalysisStageCache:
+    """Verify the opt-in analysis stage replay."""
+
+    def _run(self, stage, state):
+        import asyncio
+        from types import SimpleNamespace
+
+        ctx = SimpleNamespace(session=SimpleNamespace(state=state), invocation_id="inv", branch=None)
+
+        async def drain():
+            return [event async for event in stage._run_async_impl(ctx)]
+
+        return asyncio.run(drain())
+
+    def test_repeated_perception_output_replays_analysis(self, monkeypatch):
+        from agents import stages
+
+        runs = []
+
+        async def fake_parallel_run(self, ctx):
+            runs.append(self.name)
+            ctx.session.state.update(
+                analysis_anomalies="a", analysis_vulnerabilities="v", analysis_network="n"
+            )
+            return
+            yield
+
+        monkeypatch.setattr(stages, "ANALYSIS_STAGE_CACHE", True)
+        monkeypatch.setattr(stages, "_analysis_cache", type(stages._analysis_cache)())
+        monkeypatch.setattr(ParallelAgent, "_run_async_impl", fake_parallel_run)
+
+        perception = {"perception_scope": "assets", "perception_health": "ok"}
+        assert self._run(stages.analysis_stage, dict(perception)) == []
+        replayed = self._run(stages.analysis_stage, dict(perception))
+
+        assert runs == ["analysis_stage"]
+        assert replayed[0].actions.state_delta == {
+            "analysis_anomalies": "a",
+            "analysis_vulnerabilities": "v",
+            "analysis_network": "n",
+        }
+
+        self._run(stages.analysis_stage, {**perception, "perception_health": "degraded"})
+        assert len(runs) == 2
@@ -66,6 +66,12 @@ class TestGuardrailEnforcement:
         result = _check_blocked_commands({"command": "ls -la"})
         assert result is None
 
+    def test_blocks_nested_plan_args(self):
+        from shared.adk.observability import _check_blocked_commands
+        result = _check_blocked_commands({"actions": [{"tool": "x", "args": {"cmd": "sudo reboot"}}]})
+        assert result is not None
+        assert "reboot" in result
+
     def test_allows_empty_args(self):
         from shared.adk.observability import _check_blocked_commands
         assert _check_blocked_commands(None) is None
@@ -92,6 +98,7 @@ class TestToolConfirmation:
         assert "generic_linux_command_sync" in confirmed_names  # aliased from sync wrapper
         assert "execute_code" in confirmed_names
         assert "run_ssh_command_with_credentials" in confirmed_names
+        assert "execute_plan" in confirmed_names
 
     def test_low_risk_tools_not_confirmed(self):
         from google.adk.tools import FunctionTool
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from overwatch_platform.orchestrator import runner_factory
+
+
+class _FakeRunner:
+    def __init__(self, deltas: list[dict]) -> None:
+        self.deltas = deltas
+
+    async def run_async(self, **_kwargs):
+        for delta in self.deltas:
+            yield SimpleNamespace(actions=SimpleNamespace(state_delta=delta))
+
+
+def test_run_prompt_applies_event_state_deltas_to_session_state() -> None:
+    session = SimpleNamespace(id="s", user_id="u", state={"decision_verdict": "old", "warnings": []})
+    runner = _FakeRunner([{"perception_scope": "assets"}, {}, {"decision_verdict": "contain"}])
+
+    event_count, state = asyncio.run(runner_factory.run_prompt(runner, session, "check"))
+
+    assert event_count == 3
+    assert state == {"decision_verdict": "contain", "warnings": [], "perception_scope": "assets"}
+    assert session.state["decision_verdict"] == "old"
+
+
+class _ExistingSessionService:
+    def __init__(self, stored) -> None:
+        self.stored = stored
+
+    async def create_session(self, **_kwargs):
+        raise runner_factory.AlreadyExistsError("exists")
+
+    async def get_session(self, **_kwargs):
+        return self.stored
+
+
+def test_ensure_session_loads_existing_session() -> None:
+    stored = SimpleNamespace(id="s", user_id="u", state={})
+
+    session = asyncio.run(runner_factory.ensure_session(_ExistingSessionService(stored), "u", "s"))
+
+    assert session is stored
+
+
+def test_ensure_session_raises_when_existing_session_cannot_be_loaded() -> None:
+    with pytest.raises(RuntimeError, match="'s'"):
+        asyncio.run(runner_factory.ensure_session(_ExistingSessionService(None), "u", "s"))
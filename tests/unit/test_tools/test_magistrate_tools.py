@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+
+import pytest
+
+from agents.decision.security_magistrate import tools as magistrate_tools
+
+
+def _signals() -> list[dict]:
+    return [
+        {"source": "process_monitor", "signal_type": "suspicious_process", "affected_systems": ["web-01"]},
+        {"source": "network_monitor", "signal_type": "c2_communication", "affected_systems": ["web-01"]},
+    ]
+
+
+def test_analyze_threat_signals_memoizes_equivalent_batches() -> None:
+    magistrate_tools.analyze_threat_signals.cache_clear()
+
+    first = magistrate_tools.analyze_threat_signals(_signals())
+    again = magistrate_tools.analyze_threat_signals(list(reversed(_signals())))
+
+    assert again is first
+    assert first.attack_patterns_detected == ("ransomware_pattern",)
+    assert first.signal_count == 2
+
+    # A duplicated signal changes the count and therefore the result.
+    tripled = magistrate_tools.analyze_threat_signals(_signals() + _signals()[:1])
+    assert tripled.signal_count == 3
+
+
+def test_classify_attack_type_memoizes_and_bypasses_unhashable() -> None:
+    magistrate_tools.classify_attack_type.cache_clear()
+
+    first = magistrate_tools.classify_attack_type(["data_exfiltration"], {"bytes_transferred": 200_000_000})
+    again = magistrate_tools.classify_attack_type(["data_exfiltration"], {"bytes_transferred": 200_000_000})
+    assert again is first
+    assert first.primary_attack_type == "data_exfiltration"
+
+    unhashable = magistrate_tools.classify_attack_type(
+        ["suspicious_process"], {"files_modified": 500, "file_extension_added": [".locked"]}
+    )
+    assert unhashable.primary_attack_type == "ransomware"
+
+
+def test_classify_attack_type_detects_miner_process_case_insensitively() -> None:
+    result = magistrate_tools.classify_attack_type([], {}, process_names=["nginx", "/tmp/.X/XMRig-6.2"])
+
+    assert result.primary_attack_type == "cryptomining"
+    assert result.evidence == ("Known cryptominer process: /tmp/.X/XMRig-6.2",)
+
+
+def test_prioritize_actions_ranks_by_score_and_keeps_ties_stable() -> None:
+    threats = [
+        {"id": "a", "severity_level": "medium"},
+        {"id": "b", "severity_level": "high", "attack_type": "ransomware"},
+        {"id": "c", "severity_level": "medium"},
+        {"id": "d", "severity_level": "low", "is_spreading": True},
+    ]
+
+    result = magistrate_tools.prioritize_actions(threats)
+
+    ranked = [(item["threat"]["id"], item["priority_score"]) for item in result["prioritized_actions"]]
+    assert ranked == [("b", 90), ("a", 50), ("c", 50), ("d", 45)]
+    assert result["immediate_action_count"] == 1
+
+
+def test_json_wrapper_decodes_only_structured_parameters() -> None:
+    from agents.decision.security_magistrate import tools_gemini_compat as compat
+
+    assert asyncio.iscoroutinefunction(compat.classify_attack_type)
+    payload = json.loads(
+        asyncio.run(
+            compat.classify_attack_type(
+                signal_types='["data_exfiltration"]',
+                indicators='{"bytes_transferred": 200000000}',
+                network_behavior="[beaconing]",
+            )
+        )
+    )
+
+    assert payload["primary_attack_type"] == "data_exfiltration"
+    assert "Large data transfer: 200000000 bytes" in payload["evidence"]
+
+
+def test_single_signal_fast_path_matches_full_correlation() -> None:
+    signal = {"source": "network_monitor", "signal_type": "data_exfiltration", "affected_systems": ["db-01", "db-01"]}
+
+    fast = magistrate_tools.analyze_threat_signals([signal])
+    full = magistrate_tools._correlate_signals(
+        frozenset({("network_monitor", "data_exfiltration", frozenset({"db-01"}))}), 1
+    )
+
+    assert fast == full
+    assert fast.attack_patterns_detected == ("data_breach",)
+    assert fast.correlation_score == 0.3
+
+
+def test_prioritize_actions_top_k_returns_leading_ranks_only() -> None:
+    threats = [{"id": str(i), "severity_level": "low"} for i in range(5)]
+    threats[3]["severity_level"] = "critical"
+    threats[1]["severity_level"] = "high"
+
+    full = magistrate_tools.prioritize_actions(threats)
+    top = magistrate_tools.prioritize_actions(threats, top_k=3)
+
+    assert top["prioritized_actions"] == full["prioritized_actions"][:3]
+    assert top["total_threats"] == 5
+    assert top["immediate_action_count"] == full["immediate_action_count"] == 2
+
+
+def test_memoized_classification_cannot_be_mutated_by_callers() -> None:
+    magistrate_tools.classify_attack_type.cache_clear()
+    first = magistrate_tools.classify_attack_type(["data_exfiltration"], {})
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.all_classifications[0].confidence = 0.0
+
+    again = magistrate_tools.classify_attack_type(["data_exfiltration"], {})
+    assert dataclasses.asdict(again)["all_classifications"] == ({"type": "data_exfiltration", "confidence": 0.9},)
+
+
+def test_analyze_threat_signals_returns_result_for_empty_batch() -> None:
+    result = magistrate_tools.analyze_threat_signals([])
+
+    assert isinstance(result, magistrate_tools.AnalysisResult)
+    assert result.status == "no_signals"
+    assert result.signal_count == 0
+    assert result.recommendations == ("Request signals from monitoring agents",)
+
+
+def test_classify_attack_type_does_not_retry_errors_from_the_body(monkeypatch) -> None:
+    from functools import lru_cache
+
+    calls = []
+
+    @lru_cache(maxsize=None)
+    def broken(*args):
+        calls.append(args)
+        raise TypeError("bug inside classification")
+
+    monkeypatch.setattr(magistrate_tools, "_classify_signals", broken)
+
+    with pytest.raises(TypeError, match="bug inside classification"):
+        magistrate_tools.classify_attack_type(["data_exfiltration"], {})
+    assert len(calls) == 1
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import time
+from datetime import datetime
+
 from agents.analysis.vulnerability_assessor import tools as vuln_tools
 from agents.perception.scope_scanner import sensors as scope_sensors
 from shared.tools import cloud_tools, kubernetes_tools, security_tools
@@ -37,6 +40,7 @@ def test_cloud_inventory_handles_missing_provider_clis(monkeypatch) -> None:
 
 
 def test_scope_scanner_continues_when_runtime_discovery_fails(monkeypatch) -> None:
+    scope_sensors.collect_scope_targets.cache_clear()
     monkeypatch.setattr(
         scope_sensors,
         "discover_runtime_assets",
@@ -77,6 +81,124 @@ def test_scope_scanner_continues_when_runtime_discovery_fails(monkeypatch) -> No
     assert any("runtime discovery failed" in note for note in result["notes"])
 
 
+def test_scope_scanner_fetches_sources_concurrently(monkeypatch) -> None:
+    scope_sensors.collect_scope_targets.cache_clear()
+    def slow(result):
+        def fetch(**_kwargs):
+            time.sleep(0.2)
+            return result
+
+        return fetch
+
+    monkeypatch.setattr(scope_sensors, "discover_runtime_assets", slow({}))
+    monkeypatch.setattr(scope_sensors, "fetch_cloud_inventory", slow({"assets": [], "summary": {}}))
+    monkeypatch.setattr(scope_sensors, "get_cluster_health", slow({}))
+
+    started = time.monotonic()
+    result = scope_sensors.collect_scope_targets()
+
+    assert time.monotonic() - started < 0.5
+    assert result["sources"] == {"runtime": "ok", "cloud": "ok", "kubernetes": "ok"}
+
+
+def test_scope_scanner_collapses_dual_stack_listeners_without_cloud_assets(monkeypatch) -> None:
+    scope_sensors.collect_scope_targets.cache_clear()
+    listeners = [
+        {"port": 22, "process": "sshd", "protocol": "tcp", "local_address": "0.0.0.0:22"},
+        {"port": 22, "process": "sshd", "protocol": "tcp", "local_address": "[::]:22"},
+    ]
+    monkeypatch.setattr(
+        scope_sensors,
+        "discover_runtime_assets",
+        lambda max_processes=200: {"host": {}, "open_ports": {"listeners": listeners}},
+    )
+    monkeypatch.setattr(scope_sensors, "fetch_cloud_inventory", lambda: {"assets": [], "summary": {}})
+    monkeypatch.setattr(scope_sensors, "get_cluster_health", lambda: {"status": "ok", "cluster": "dev"})
+
+    result = scope_sensors.collect_scope_targets()
+
+    ids = [asset["asset_id"] for asset in result["assets"]]
+    assert sum(asset_id.startswith("port-22-") for asset_id in ids) == 1
+    assert len(ids) == len(set(ids)) == 3
+    assert result["summary"]["critical_assets"] == 2
+    assert result["summary"]["external_assets"] == 1
+    summary = result["summary"]
+    assert datetime.fromisoformat(summary["scan_timestamp"]).timestamp() == summary["scan_epoch"]
+
+
+def test_scope_scanner_reuses_recent_scan_for_identical_requests(monkeypatch) -> None:
+    scope_sensors.collect_scope_targets.cache_clear()
+    calls = []
+
+    def discover(max_processes=200):
+        calls.append(max_processes)
+        return {}
+
+    monkeypatch.setattr(scope_sensors, "discover_runtime_assets", discover)
+    monkeypatch.setattr(scope_sensors, "fetch_cloud_inventory", lambda: {"assets": [], "summary": {}})
+    monkeypatch.setattr(scope_sensors, "get_cluster_health", lambda: {})
+
+    first = scope_sensors.collect_scope_targets()
+    assert scope_sensors.collect_scope_targets() == first
+    assert scope_sensors.collect_scope_targets(max_assets=10) != first
+    assert calls == [200, 200]
+
+    scope_sensors.collect_scope_targets.cache_clear()
+    scope_sensors.collect_scope_targets()
+    assert len(calls) == 3
+
+
+def test_ttl_cache_normalizes_call_forms_and_isolates_results() -> None:
+    from shared.utils.cache import ttl_cache
+
+    calls = []
+
+    @ttl_cache(ttl=60, copy_result=True)
+    def lookup(query: str, limit: int = 10) -> dict:
+        calls.append((query, limit))
+        return {"query": query, "rows": [limit]}
+
+    first = lookup("cpu")
+    assert lookup(query="cpu") == first
+    assert lookup("cpu", 10) == first
+    assert lookup("cpu", limit=10) == first
+    assert calls == [("cpu", 10)]
+
+    first["rows"].append("mutated")
+    again = lookup("cpu")
+    again["query"] = "changed"
+    assert lookup("cpu") == {"query": "cpu", "rows": [10]}
+    assert calls == [("cpu", 10)]
+
+
+def test_ttl_cache_shares_results_and_survives_concurrent_callers() -> None:
+    import threading
+
+    from shared.utils.cache import ttl_cache
+
+    @ttl_cache(ttl=60, maxsize=4)
+    def lookup(key: int) -> dict:
+        return {"key": key}
+
+    assert lookup(1) is lookup(1)
+
+    errors = []
+
+    def hammer(offset: int) -> None:
+        try:
+            for i in range(500):
+                assert lookup((i + offset) % 32) == {"key": (i + offset) % 32}
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=hammer, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
 def test_vulnerability_sweep_uses_scope_targets(monkeypatch) -> None:
     monkeypatch.setattr(
         vuln_tools,
@@ -105,3 +227,51 @@ def test_vulnerability_sweep_uses_scope_targets(monkeypatch) -> None:
     assert result["total_targets_scanned"] == 2
     assert result["targets_scanned"] == ["10.0.0.7", "db-1"]
     assert result["total_findings"] == 0
+
+
+def test_serialization_round_trip_matches_stdlib_with_and_without_orjson(monkeypatch) -> None:
+    import enum
+    import json
+    import math
+
+    from shared.utils import serialization
+
+    class Level(enum.Enum):
+        HIGH = "high"
+
+    payload = {"latest": float("nan"), "captured": datetime(2026, 1, 2, 3, 4, 5), "level": Level.HIGH}
+    expected = json.loads(json.dumps(payload, default=str))
+
+    for backend in (serialization.orjson, None):
+        monkeypatch.setattr(serialization, "orjson", backend)
+        decoded = serialization.loads(serialization.dumps(payload))
+
+        assert math.isnan(decoded["latest"])
+        assert decoded["captured"] == expected["captured"] == "2026-01-02 03:04:05"
+        assert decoded["level"] == expected["level"] == "Level.HIGH"
+
+
+def test_scope_scanner_keeps_last_record_for_duplicate_cloud_assets(monkeypatch) -> None:
+    scope_sensors.collect_scope_targets.cache_clear()
+    monkeypatch.setattr(scope_sensors, "discover_runtime_assets", lambda max_processes=200: {})
+    monkeypatch.setattr(
+        scope_sensors,
+        "fetch_cloud_inventory",
+        lambda: {
+            "assets": [
+                {"asset_id": "vm-1", "asset_name": "web", "provider": "aws", "status": "stopped"},
+                {"asset_id": "vm-2", "asset_name": "db", "provider": "aws"},
+                {"asset_id": "vm-1", "asset_name": "web", "provider": "aws", "status": "running"},
+            ],
+            "summary": {},
+        },
+    )
+    monkeypatch.setattr(scope_sensors, "get_cluster_health", lambda: {})
+
+    result = scope_sensors.collect_scope_targets()
+
+    assert [(asset["asset_id"], asset["status"]) for asset in result["assets"]] == [
+        ("vm-1", "running"),
+        ("vm-2", "active"),
+    ]
+    assert result["summary"]["total_assets"] == 2
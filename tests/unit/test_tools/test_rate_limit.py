@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+from shared.security_tools.rate_limit import is_rate_limited, rate_limited
+from shared.utils.cache import ttl_cache
+
+
+def test_rate_limited_denies_after_burst_without_calling_tool() -> None:
+    calls: list[str] = []
+
+    @rate_limited("high")
+    def run(command: str) -> str:
+        calls.append(command)
+        return "ok"
+
+    results = [run(f"cmd-{i}") for i in range(12)]
+
+    assert results[:10] == ["ok"] * 10
+    assert results[10]["error"] == "rate_limited"
+    assert results[10]["retry_after_ms"] > 0
+    assert len(calls) == 10
+    assert run.__name__ == "run"
+
+
+def test_rate_limited_keeps_coroutine_tools_async() -> None:
+    @rate_limited("low")
+    async def verify(action_id: str) -> dict:
+        return {"verified": True, "action_id": action_id}
+
+    assert asyncio.iscoroutinefunction(verify)
+    assert asyncio.run(verify("exec-1")) == {"verified": True, "action_id": "exec-1"}
+
+
+def test_cache_hits_in_front_of_limiter_take_no_tokens() -> None:
+    calls: list[str] = []
+
+    @ttl_cache(ttl=60, skip=is_rate_limited)
+    @rate_limited("high")
+    def status(target: str) -> dict:
+        calls.append(target)
+        return {"target": target}
+
+    assert [status("web-01") for _ in range(20)] == [{"target": "web-01"}] * 20
+    assert calls == ["web-01"]
+
+    for i in range(9):
+        status(f"host-{i}")
+    denied = status("db-01")
+    assert is_rate_limited(denied)
+    # The denial was not cached: the next call reaches the limiter again.
+    status.bucket.tokens = 1.0
+    assert status("db-01") == {"target": "db-01"}
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from agents.action.security_enforcer import tools as enforcer_tools
+
+
+def test_execute_command_reuses_shell_and_isolates_state(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", False)
+
+    first = asyncio.run(enforcer_tools.execute_command("cd / && pwd; echo oops >&2; exit 3", "localhost"))
+    second = asyncio.run(enforcer_tools.execute_command("pwd", "localhost", working_directory="/tmp"))
+
+    assert first["exit_code"] == 3
+    assert first["success"] is False
+    assert first["stdout"] == "/\n"
+    assert first["stderr"] == "oops\n"
+    assert second["success"] is True
+    assert second["stdout"] == "/tmp\n"
+
+
+def test_execute_command_times_out_and_recovers(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", False)
+
+    timed_out = asyncio.run(enforcer_tools.execute_command("sleep 5", "localhost", timeout_seconds=0.2))
+    recovered = asyncio.run(enforcer_tools.execute_command("echo ok", "localhost"))
+
+    assert timed_out == {"success": False, "error": "Command timed out"}
+    assert recovered["stdout"] == "ok\n"
+
+
+def test_execute_command_blocks_dangerous_patterns() -> None:
+    result = asyncio.run(enforcer_tools.execute_command("sudo mkfs.ext4 /dev/sda1", "localhost"))
+
+    assert result["success"] is False
+    assert "mkfs" in result["error"]
+
+
+def test_mocked_remediations_run_concurrently(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", True)
+    monkeypatch.setattr(enforcer_tools, "MOCK_DELAY_SECONDS", 0.2)
+
+    async def _batch() -> list[dict]:
+        return await asyncio.gather(
+            *(enforcer_tools.rotate_credentials(f"user-{i}") for i in range(5))
+        )
+
+    started = time.perf_counter()
+    results = asyncio.run(_batch())
+
+    assert all(result["success"] for result in results)
+    assert time.perf_counter() - started < 0.8
+
+
+def test_isolate_system_rejects_injected_container_id(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", False)
+
+    result = asyncio.run(enforcer_tools.isolate_system("container/abc;reboot"))
+
+    assert result["success"] is False
+    assert "Invalid container id" in result["error"]
+
+
+def test_docker_actions_reject_option_like_container_ids(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", False)
+
+    async def _no_docker(*_args, **_kwargs):
+        raise AssertionError("docker must not be invoked")
+
+    monkeypatch.setattr(enforcer_tools, "_docker_call", _no_docker)
+
+    isolated = asyncio.run(enforcer_tools.isolate_system("container/--privileged"))
+    killed = asyncio.run(enforcer_tools.terminate_process("-s", identifier_type="container_id"))
+
+    assert isolated["success"] is False
+    assert "Invalid container id" in isolated["error"]
+    assert killed["success"] is False
+    assert "Invalid container id" in killed["error"]
+
+
+def test_execute_plan_runs_actions_and_rejects_unknown_tools(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", True)
+    monkeypatch.setattr(enforcer_tools, "MOCK_DELAY_SECONDS", 0)
+
+    result = asyncio.run(
+        enforcer_tools.execute_plan(
+            [
+                {"tool": "block_network_traffic", "args": {"target": "203.0.113.7"}},
+                {"tool": "disable_credentials", "args": {"credential_id": "svc-backup"}},
+                {"tool": "execute_command", "args": {"command": "id", "target_system": "localhost"}},
+            ]
+        )
+    )
+
+    assert result["success"] is False
+    assert [entry["tool"] for entry in result["results"]] == [
+        "block_network_traffic",
+        "disable_credentials",
+        "execute_command",
+    ]
+    assert result["results"][0]["success"] is True
+    assert result["results"][1]["success"] is True
+    assert "Unsupported plan tool" in result["results"][2]["error"]
+
+
+def test_execute_plan_keeps_gated_tools_and_blocked_args_out(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", True)
+    monkeypatch.setattr(enforcer_tools, "MOCK_DELAY_SECONDS", 0)
+
+    gated = asyncio.run(
+        enforcer_tools.execute_plan(
+            [
+                {"tool": "terminate_process", "args": {"process_identifier": "4242"}},
+                {"tool": "isolate_system", "args": {"system_id": "container/web"}},
+            ]
+        )
+    )
+    assert [entry["error"] for entry in gated["results"]] == [
+        "Unsupported plan tool: terminate_process",
+        "Unsupported plan tool: isolate_system",
+    ]
+
+    blocked = asyncio.run(
+        enforcer_tools.execute_plan(
+            [
+                {"tool": "block_network_traffic", "args": {"target": "203.0.113.7"}},
+                {"tool": "verify_remediation", "args": {"action_id": "x; shutdown now"}},
+            ]
+        )
+    )
+    assert blocked == {
+        "success": False,
+        "error": "Blocked by guardrail policy: command contains 'shutdown'",
+    }
+
+
+def test_execute_command_keeps_only_output_tail(monkeypatch) -> None:
+    monkeypatch.setattr(enforcer_tools, "MOCK_MODE", False)
+
+    result = asyncio.run(
+        enforcer_tools.execute_command("head -c 300000 /dev/zero | tr '\\0' x; echo END", "localhost")
+    )
+
+    assert result["truncated"] is True
+    assert len(result["stdout"]) == enforcer_tools._OUTPUT_CAP
+    assert result["stdout"].endswith("xEND\n")
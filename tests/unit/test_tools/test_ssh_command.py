@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+import stat
+import time
+
+from shared.security_tools import ssh_command
+
+# Stand-ins for sshpass/ssh: the "master" forks a child that keeps stderr open
+# for a few seconds, the way a real ControlPersist master does.
+_FAKE_SSHPASS = """#!/bin/sh
+export FAKE_SSH_PASSWORD="$2"
+shift 2
+exec "$@"
+"""
+
+_FAKE_SSH = """#!/bin/sh
+echo "$*" >> "$FAKE_SSH_LOG"
+path=""
+mode=""
+prev=""
+for arg in "$@"; do
+  case "$arg" in
+    ControlPath=*) path="${arg#ControlPath=}" ;;
+    -N) mode="master" ;;
+  esac
+  if [ "$prev" = "-O" ]; then mode="$arg"; fi
+  prev="$arg"
+  last="$arg"
+done
+case "$mode" in
+  check) [ -e "$path.alive" ] && exit 0 || exit 255 ;;
+  exit) rm -f "$path.alive"; exit 0 ;;
+  master)
+    if [ "$FAKE_SSH_PASSWORD" != "right" ]; then echo "Permission denied" >&2; exit 255; fi
+    touch "$path.alive"
+    sleep 3 &
+    exit 0 ;;
+esac
+echo "ran: $last"
+"""
+
+
+def _install_fakes(tmp_path, monkeypatch) -> str:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, script in (("sshpass", _FAKE_SSHPASS), ("ssh", _FAKE_SSH)):
+        path = bin_dir / name
+        path.write_text(script)
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    log = tmp_path / "ssh.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_SSH_LOG", str(log))
+    monkeypatch.setattr(ssh_command, "_CONTROL_DIR", str(tmp_path / "ctl"))
+    monkeypatch.setattr(ssh_command, "_SESSIONS", {})
+    return str(log)
+
+
+def _log_lines(log: str) -> list[str]:
+    with open(log) as fh:
+        return fh.read().splitlines()
+
+
+def test_ssh_master_with_open_stderr_does_not_block_and_is_reused(tmp_path, monkeypatch) -> None:
+    log = _install_fakes(tmp_path, monkeypatch)
+
+    started = time.monotonic()
+    first = ssh_command.run_ssh_command_with_credentials("10.0.0.5", "ops", "right", "uptime")
+    second = ssh_command.run_ssh_command_with_credentials("10.0.0.5", "ops", "right", "whoami")
+
+    assert time.monotonic() - started < 2
+    assert (first, second) == ("ran: uptime", "ran: whoami")
+    assert sum(" -N " in line for line in _log_lines(log)) == 1
+    ssh_command.reset_cache()
+
+
+def test_ssh_credential_change_tears_down_the_master(tmp_path, monkeypatch) -> None:
+    log = _install_fakes(tmp_path, monkeypatch)
+
+    assert ssh_command.run_ssh_command_with_credentials("10.0.0.5", "ops", "right", "id") == "ran: id"
+    rejected = ssh_command.run_ssh_command_with_credentials("10.0.0.5", "ops", "revoked", "id")
+
+    assert rejected.startswith("Error: SSH connection failed")
+    assert "Permission denied" in rejected
+    assert any("-O exit" in line for line in _log_lines(log))
+    assert ssh_command._SESSIONS == {}
+
+
+def test_ssh_string_port_shares_one_session_entry(tmp_path, monkeypatch) -> None:
+    _install_fakes(tmp_path, monkeypatch)
+
+    ssh_command.run_ssh_command_with_credentials("10.0.0.5", "ops", "right", "id", port="2222")
+    assert list(ssh_command._SESSIONS) == [("ops", "10.0.0.5", 2222)]
+
+    ssh_command.invalidate_cache_entry("ops", "10.0.0.5", "2222")
+    assert ssh_command._SESSIONS == {}
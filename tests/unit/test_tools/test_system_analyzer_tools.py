@@ -93,3 +93,30 @@ def test_analyze_local_system_uses_discovery_and_metrics(monkeypatch) -> None:
     assert result["discovered_assets"] == fake_assets
     assert result["metrics"]["source"] == "live"
     assert "analysis" in result
+
+
+def test_score_anomaly_ignores_nan_metric_samples() -> None:
+    from agents.analysis.anomaly_detector.models import score_anomaly
+
+    features = {
+        "metrics": {
+            "series": [
+                {"name": "cpu_usage_percent", "latest": float("nan")},
+                {"name": "error_rate_percent", "latest": 2.5},
+            ]
+        },
+        "findings": [],
+    }
+
+    assert score_anomaly(features) == 0.12
+
+
+def test_score_anomaly_scores_infinite_metric_samples_in_top_band() -> None:
+    from agents.analysis.anomaly_detector.models import score_anomaly
+
+    features = {
+        "metrics": {"series": [{"name": "cpu_usage_percent", "latest": float("inf")}]},
+        "findings": [],
+    }
+
+    assert score_anomaly(features) == 0.2